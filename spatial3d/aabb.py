@@ -1,5 +1,5 @@
 import math
-from functools import cached_property
+from itertools import repeat
 from typing import Iterable, List, Optional, Tuple, Union
 
 from .coordinate_axes import CoordinateAxes
@@ -12,50 +12,97 @@ Boundable = Union[Vector3, "AABB", Iterable[Vector3], Iterable["AABB"]]
 class AABB:
     """An axis-aligned bounding box."""
 
+    __slots__ = ["min", "max", "_center", "_corners", "_empty"]
+
     def __init__(self, objects: Optional[Boundable] = None) -> None:
         """Construct a bounding box that bounds a list of points or other bounding boxes."""
+        # Lazily computed on access and reset whenever the bounding box is expanded.
+        self._center: Optional[Vector3] = None
+        self._corners: Optional[List[Vector3]] = None
+
+        # A flat list of points (e.g., a facet's vertices) is the common case. Its bounds are
+        # computed directly rather than expanding an empty bounding box.
+        if (
+            isinstance(objects, (list, tuple))
+            and objects
+            and all(map(isinstance, objects, repeat(Vector3)))
+        ):
+            xs = [point.x for point in objects]
+            ys = [point.y for point in objects]
+            zs = [point.z for point in objects]
+
+            self.min = Vector3(min(xs), min(ys), min(zs))
+            self.max = Vector3(max(xs), max(ys), max(zs))
+            self._empty = False
+            return
+
         self.min = Vector3(math.inf, math.inf, math.inf)
         self.max = -Vector3(math.inf, math.inf, math.inf)
+        self._empty = True
 
         if objects is not None:
             self.expand(objects)
 
+    @classmethod
+    def _from_bounds(cls, minimum: Vector3, maximum: Vector3) -> "AABB":
+        """Construct a bounding box directly from its minimum and maximum corners.
+
+        The corners are used as is (not copied) and are not checked, so this skips AABB.expand.
+        """
+        aabb = cls.__new__(cls)
+        aabb.min = minimum
+        aabb.max = maximum
+        aabb._center = None
+        aabb._corners = None
+        aabb._empty = False
+
+        return aabb
+
     def __str__(self) -> str:
         """Return the string representation of the minimum and maximum corner points."""
         return f"Min: {self.min}, Max: {self.max}"
 
-    @cached_property
+    @property
     def center(self) -> Vector3:
         """Return the center point of the bounding box."""
-        # It's enough to check that one component is infinite to determine that all of them are
-        # (assuming that the AABB is only manipulated by calls to AABB.expand)
-        if math.isinf(self.min[0]):
-            return Vector3(0, 0, 0)
+        if self._center is None:
+            if self._empty:
+                self._center = Vector3(0, 0, 0)
+            else:
+                self._center = self.min + (self.size / 2)
 
-        return self.min + (self.size / 2)
+        return self._center
 
-    @cached_property
+    @property
     def corners(self) -> List[Vector3]:
         """Return all eight corner points of the bounding box."""
-        size = self.size
-        x = Vector3(x=size.x)
-        y = Vector3(y=size.y)
-
-        return [
-            self.max,
-            self.max - x,
-            self.max - x - y,
-            self.max - y,
-            self.min,
-            self.min + x,
-            self.min + x + y,
-            self.min + y,
-        ]
+        if self._corners is None:
+            # Build each corner directly from the extreme coordinates rather than by adding and
+            # subtracting the box size (which also avoids any rounding in that arithmetic).
+            low, high = self.min, self.max
+
+            self._corners = [
+                high,
+                Vector3(low.x, high.y, high.z),
+                Vector3(low.x, low.y, high.z),
+                Vector3(high.x, low.y, high.z),
+                low,
+                Vector3(high.x, low.y, low.z),
+                Vector3(high.x, high.y, low.z),
+                Vector3(low.x, high.y, low.z),
+            ]
+
+        return self._corners
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if the bounding box has not been expanded to bound anything."""
+        return self._empty
 
     @property
     def size(self) -> Vector3:
         """Return the bounding box size for each coordinate axis."""
-        if math.isinf(self.min[0]):
+        if self._empty:
             return self.min
 
         return self.max - self.min
@@ -66,64 +113,45 @@ class AABB:
 
     def contains(self, point: Vector3) -> bool:
         """Return True if the bounding box contains the point."""
-        return all(low <= value <= high for low, value, high in zip(self.min, point, self.max))
+        low, high = self.min, self.max
+        return (
+            low.x <= point.x <= high.x and low.y <= point.y <= high.y and low.z <= point.z <= high.z
+        )
 
     def expand(self, objects: Boundable) -> None:
         """Expand the bounding box to include the passed points and bounding boxes."""
-        # If the passed parameter looks iterable, try to break it up recursively
-        if isinstance(objects, (list, tuple)):
-            for obj in objects:
-                self.expand(obj)
-        elif isinstance(objects, AABB):
-            # Expand the bounding box with the corner points
-            self.expand([objects.min, objects.max])
-        elif isinstance(objects, Vector3):
-            for coordinate, value in enumerate(objects):
-                self.min[coordinate] = min(value, self.min[coordinate])
-                self.max[coordinate] = max(value, self.max[coordinate])
-
-            # Invalidate the cached properties.
-            if self.corners is not None:
-                del self.corners
-
-            if self.center is not None:
-                del self.center
-        else:
-            raise TypeError(f"Unexpected type passed to AABB.expand: {type(objects)}")
+        points = []
+
+        # Flatten any nested lists, tuples, and bounding boxes into their points with an explicit
+        # stack rather than recursing so the points can be reduced in bulk below
+        stack = [objects]
+        while stack:
+            obj = stack.pop()
+
+            if isinstance(obj, Vector3):
+                points.append(obj)
+            elif isinstance(obj, (list, tuple)):
+                stack.extend(obj)
+            elif isinstance(obj, AABB):
+                # Expand the bounding box with the corner points (an empty box has nothing to add)
+                if not obj.is_empty:
+                    points.append(obj.min)
+                    points.append(obj.max)
+            else:
+                raise TypeError(f"Unexpected type passed to AABB.expand: {type(obj)}")
+
+        if points:
+            self._expand_points(points)
 
     def intersect(self, ray, min_t: float = 0, max_t: float = math.inf) -> bool:
         """Return True if the provided ray intersects the bounding box."""
-        t_intersection = [min_t, max_t]
-
-        # Check bounding slab intersections per component (x, y, z)
-        for minimum, maximum, origin, direction in zip(
-            self.min, self.max, ray.origin, ray.direction
-        ):
-            try:
-                inv_direction = 1 / direction
-            except ZeroDivisionError:
-                inv_direction = math.inf
-
-            t_min = (minimum - origin) * inv_direction
-            t_max = (maximum - origin) * inv_direction
-
-            # Swap if reordering is necessary
-            if t_min > t_max:
-                t_min, t_max = t_max, t_min
-
-            if t_min > t_intersection[0]:
-                t_intersection[0] = t_min
-            if t_max < t_intersection[1]:
-                t_intersection[1] = t_max
-
-            if t_intersection[0] > t_intersection[1]:
-                return False
-
-        return True
+        inv_direction = _inv_direction(ray)
+        return intersect_ray_aabb(self.min, self.max, ray.origin, inv_direction, min_t, max_t)
 
     def sphere_radius(self) -> float:
         """Return the radius of a bounding sphere which contains the bounding box."""
-        return max((self.center - corner).length() for corner in self.corners)
+        # Every corner is equidistant from the center so the radius is half the diagonal.
+        return (self.size / 2).length()
 
     def split(self, axis: CoordinateAxes, value: float) -> Tuple["AABB", "AABB"]:
         """Return two new child bounding boxes from splitting the existing bounding box.
@@ -138,18 +166,127 @@ class AABB:
                 f"({self.min[axis]} , {self.max[axis]})"
             )
 
-        left_max = Vector3(*self.max)
+        low, high = self.min, self.max
+
+        left_max = Vector3(high.x, high.y, high.z)
         left_max[axis] = value
 
-        left = AABB([self.min, left_max])
+        left = AABB._from_bounds(Vector3(low.x, low.y, low.z), left_max)
 
-        right_min = Vector3(*self.min)
+        right_min = Vector3(low.x, low.y, low.z)
         right_min[axis] = value
 
-        right = AABB([right_min, self.max])
+        right = AABB._from_bounds(right_min, Vector3(high.x, high.y, high.z))
 
         return left, right
 
+    def _expand_points(self, points: List[Vector3]) -> None:
+        """Expand the bounding box to include all of the passed points.
+
+        Each bound is found with a single call to the builtin min or max function rather than
+        comparing the points one at a time.
+        """
+        xs = [point.x for point in points]
+        ys = [point.y for point in points]
+        zs = [point.z for point in points]
+
+        self.min.x = min(self.min.x, *xs)
+        self.min.y = min(self.min.y, *ys)
+        self.min.z = min(self.min.z, *zs)
+
+        self.max.x = max(self.max.x, *xs)
+        self.max.y = max(self.max.y, *ys)
+        self.max.z = max(self.max.z, *zs)
+
+        self._empty = False
+
+        # Invalidate the cached properties.
+        self._center = None
+        self._corners = None
+
     def transform(self, transform: Transform) -> "AAAB":
         """Return an AABB transformed with the provided transform."""
         return AABB(transform(self.corners, as_type="point"))
+
+
+def intersect_many(
+    boxes: Iterable[AABB], ray, min_t: float = 0, max_t: float = math.inf
+) -> List[bool]:
+    """Return whether the provided ray intersects each of the bounding boxes.
+
+    The reciprocal of the ray direction (see `Ray.inv_direction`) is shared by every slab test.
+    """
+    origin = ray.origin
+    inv_direction = _inv_direction(ray)
+
+    return [
+        intersect_ray_aabb(box.min, box.max, origin, inv_direction, min_t, max_t) for box in boxes
+    ]
+
+
+# pylint: disable-next=too-many-arguments
+def intersect_ray_aabb(
+    minimum: Vector3,
+    maximum: Vector3,
+    origin: Vector3,
+    inv_direction: Vector3,
+    min_t: float = 0,
+    max_t: float = math.inf,
+) -> bool:
+    """Return True if the ray intersects the bounding box given by its minimum and maximum corners.
+
+    The ray is given by its origin and the component-wise reciprocal of its direction (see
+    `inverse_direction`) so the reciprocal can be computed once and reused across many boxes.
+    """
+    # Check bounding slab intersections per component (x, y, z)
+    t_min = (minimum.x - origin.x) * inv_direction.x
+    t_max = (maximum.x - origin.x) * inv_direction.x
+    if t_min > t_max:
+        t_min, t_max = t_max, t_min
+    if t_min > min_t:
+        min_t = t_min
+    if t_max < max_t:
+        max_t = t_max
+
+    t_min = (minimum.y - origin.y) * inv_direction.y
+    t_max = (maximum.y - origin.y) * inv_direction.y
+    if t_min > t_max:
+        t_min, t_max = t_max, t_min
+    if t_min > min_t:
+        min_t = t_min
+    if t_max < max_t:
+        max_t = t_max
+
+    t_min = (minimum.z - origin.z) * inv_direction.z
+    t_max = (maximum.z - origin.z) * inv_direction.z
+    if t_min > t_max:
+        t_min, t_max = t_max, t_min
+    if t_min > min_t:
+        min_t = t_min
+    if t_max < max_t:
+        max_t = t_max
+
+    return min_t <= max_t
+
+
+def inverse_direction(direction: Vector3) -> Vector3:
+    """Return the component-wise reciprocal of a ray direction for use in slab intersection tests.
+
+    A zero direction component means the ray is parallel to that bounding slab.
+    """
+    return Vector3(
+        1 / direction.x if direction.x else math.inf,
+        1 / direction.y if direction.y else math.inf,
+        1 / direction.z if direction.z else math.inf,
+    )
+
+
+def _inv_direction(ray) -> Vector3:
+    """Return the reciprocal of the ray direction.
+
+    A `Ray` stores its reciprocal. Other ray-like objects only need an origin and a direction.
+    """
+    try:
+        return ray.inv_direction
+    except AttributeError:
+        return inverse_direction(ray.direction)
@@ -1,7 +1,6 @@
-from typing import Generic, TypeVar, Union
+from typing import Generic, Tuple, TypeVar, Union
 
 from .quaternion import Quaternion
-from .quaternion import conjugate as quaternion_conjugate
 
 T = TypeVar("T", float, int, Quaternion)
 
@@ -9,6 +8,8 @@ T = TypeVar("T", float, int, Quaternion)
 class Dual(Generic[T]):
     """Class for representing dual (numbers) of the form r + dε."""
 
+    __slots__ = ["r", "d"]
+
     def __init__(self, r: T, d: T) -> None:
         self.r: T = r
         self.d: T = d
@@ -43,12 +44,21 @@ class Dual(Generic[T]):
         If passed a scalar, scalar multiplication is performed.
         If passed a dual, dual multiplication is performed.
         """
-        if isinstance(other, (float, int)):
-            return Dual(other * self.r, other * self.d)
-
+        # Check for a dual first since dual products dominate transform composition.
         if isinstance(other, Dual):
+            if (
+                isinstance(self.r, Quaternion)
+                and isinstance(self.d, Quaternion)
+                and isinstance(other.r, Quaternion)
+                and isinstance(other.d, Quaternion)
+            ):
+                return _quaternion_product(self, other)
+
             return Dual(self.r * other.r, self.r * other.d + self.d * other.r)
 
+        if isinstance(other, (float, int)):
+            return Dual(other * self.r, other * self.d)
+
         return NotImplemented
 
     def __round__(self, places: int = 0) -> "Dual":
@@ -81,7 +91,10 @@ class Dual(Generic[T]):
         """Conjugates the dual instance."""
         if isinstance(self.r, Quaternion) and isinstance(self.d, Quaternion):
             self.r.conjugate()
-            self.d = -quaternion_conjugate(self.d)
+
+            # The negated conjugate only flips the sign of the scalar part.
+            d = self.d
+            self.d = Quaternion(-d.r, d.x, d.y, d.z)
         elif isinstance(self.r, (int, float)) and isinstance(self.d, (int, float)):
             self.d = -self.d
         else:
@@ -91,6 +104,52 @@ class Dual(Generic[T]):
 def conjugate(dual: Dual) -> Dual:
     """Return the conjugate of the provided Dual quaternion."""
     if isinstance(dual.r, Quaternion) and isinstance(dual.d, Quaternion):
-        return Dual(quaternion_conjugate(dual.r), -quaternion_conjugate(dual.d))
+        # The sign flips are applied directly rather than conjugating and then negating.
+        r, d = dual.r, dual.d
+        return Dual(Quaternion(r.r, -r.x, -r.y, -r.z), Quaternion(-d.r, d.x, d.y, d.z))
 
     raise NotImplementedError
+
+
+def translation(dual: Dual) -> Tuple[float, float, float]:
+    """Return the components of the translation of the provided (unit) dual quaternion."""
+    # This is the vector part of 2 * d * conjugate(r) written out so the conjugate and product are
+    # not created.
+    r, d = dual.r, dual.d
+
+    return (
+        2 * (d.x * r.r - d.r * r.x - d.y * r.z + d.z * r.y),
+        2 * (d.x * r.z - d.r * r.y + d.y * r.r - d.z * r.x),
+        2 * (-d.r * r.z - d.x * r.y + d.y * r.x + d.z * r.r),
+    )
+
+
+# The components are unpacked into locals to keep the written out products readable.
+# pylint: disable-next=too-many-locals
+def _quaternion_product(a: Dual, b: Dual) -> Dual:
+    """Return the product of two dual quaternions.
+
+    This is (ar + ad ε)(br + bd ε) = ar br + (ar bd + ad br) ε written out component-wise so the
+    intermediate quaternions are not created. The terms are evaluated in the same order as the
+    quaternion products so the result is identical.
+    """
+    ar, ax, ay, az = a.r.r, a.r.x, a.r.y, a.r.z
+    dr, dx, dy, dz = a.d.r, a.d.x, a.d.y, a.d.z
+    br, bx, by, bz = b.r.r, b.r.x, b.r.y, b.r.z
+    er, ex, ey, ez = b.d.r, b.d.x, b.d.y, b.d.z
+
+    real = Quaternion(
+        ar * br - ax * bx - ay * by - az * bz,
+        ar * bx + ax * br + ay * bz - az * by,
+        ar * by - ax * bz + ay * br + az * bx,
+        ar * bz + ax * by - ay * bx + az * br,
+    )
+
+    dual = Quaternion(
+        (ar * er - ax * ex - ay * ey - az * ez) + (dr * br - dx * bx - dy * by - dz * bz),
+        (ar * ex + ax * er + ay * ez - az * ey) + (dr * bx + dx * br + dy * bz - dz * by),
+        (ar * ey - ax * ez + ay * er + az * ex) + (dr * by - dx * bz + dy * br + dz * bx),
+        (ar * ez + ax * ey - ay * ex + az * er) + (dr * bz + dx * by - dy * bx + dz * br),
+    )
+
+    return Dual(real, dual)
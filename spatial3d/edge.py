@@ -1,4 +1,5 @@
-from functools import cached_property
+import math
+from typing import FrozenSet, Optional, Tuple
 
 from .vector3 import Vector3
 
@@ -6,29 +7,57 @@ from .vector3 import Vector3
 class Edge:
     """An edge created by two points."""
 
+    __slots__ = ["start", "end", "_key", "_length", "_vector"]
+
     def __init__(self, start: Vector3, end: Vector3) -> None:
         self.start = start
         self.end = end
 
+        # Lazily computed on first access.
+        self._key: Optional[FrozenSet[Tuple[float, float, float]]] = None
+        self._length: Optional[float] = None
+        self._vector: Optional[Vector3] = None
+
     def __eq__(self, other: object) -> bool:
-        """Return True if this edge is equal to the other."""
+        """Return True if this edge is equal to the other (regardless of direction)."""
+        if self is other:
+            return True
+
         if isinstance(other, Edge):
-            if self.start == other.start and self.end == other.end:
-                return True
+            return self.key == other.key
 
-            if self.start == other.end and self.end == other.start:
-                return True
+        return NotImplemented
 
-            return False
+    def __hash__(self) -> int:
+        """Return a hash of the edge's endpoints (regardless of direction)."""
+        return hash(self.key)
 
-        return NotImplemented
+    @property
+    def key(self) -> FrozenSet[Tuple[float, float, float]]:
+        """Return the edge's endpoint coordinates as a direction independent, hashable key.
 
-    @cached_property
+        The key is computed once so the endpoints should not be modified afterwards.
+        """
+        if self._key is None:
+            start, end = self.start, self.end
+            self._key = frozenset(((start.x, start.y, start.z), (end.x, end.y, end.z)))
+
+        return self._key
+
+    @property
     def length(self) -> float:
         """Return the length of the edge."""
-        return self.vector.length()
+        if self._length is None:
+            # Computed from the endpoints directly so the edge vector does not have to be created.
+            start, end = self.start, self.end
+            self._length = math.hypot(end.x - start.x, end.y - start.y, end.z - start.z)
 
-    @cached_property
+        return self._length
+
+    @property
     def vector(self) -> Vector3:
         """Return the edge's vector from start to end."""
-        return self.end - self.start
+        if self._vector is None:
+            self._vector = self.end - self.start
+
+        return self._vector
@@ -1,10 +1,14 @@
 """Euler Angles library."""
 
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List
 
 from .axes import Axes
 from .order import Order
 
+if TYPE_CHECKING:
+    # Only imported for annotations since the quaternion module imports this package.
+    from ..quaternion import Quaternion
+
 
 def angles(
     quaternion: "Quaternion", axes: Axes = Axes.ZYZ, order: Order = Order.INTRINSIC
@@ -23,3 +27,22 @@ def angles(
         solutions = [angles[::-1] for angles in solutions]
 
     return solutions
+
+
+def angles_many(
+    quaternions: Iterable["Quaternion"], axes: Axes = Axes.ZYZ, order: Order = Order.INTRINSIC
+) -> List[List[List[float]]]:
+    """Return the requested Euler angles and type from each of the provided quaternions.
+
+    See `angles`. The arguments are checked and the conversion is resolved once for the batch.
+    """
+    if not isinstance(axes, Axes) or not isinstance(order, Order):
+        raise TypeError("Unknown type passed to function")
+
+    if order == Order.EXTRINSIC:
+        return [
+            [angles[::-1] for angles in solutions]
+            for solutions in axes.reverse().convert_many(quaternions)
+        ]
+
+    return axes.convert_many(quaternions)
@@ -4,12 +4,16 @@
 
 import enum
 import math
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
 from spatial3d.vector3 import Vector3
 
 from ..parameters import parameters
 
+if TYPE_CHECKING:
+    # Only imported for annotations since the quaternion module imports this package.
+    from ..quaternion import Quaternion
+
 
 class Axes(enum.Enum):
     """All the different types of Euler angles."""
@@ -30,33 +34,34 @@ class Axes(enum.Enum):
     @classmethod
     def basis_vector(cls, axis: str) -> Vector3:
         """Return a basis vector corresponding to the provided axis letter."""
-        v = Vector3()
-
         # For now, allow exceptions for unrecognized `axis` to go uncaught
-        setattr(v, axis, 1)
-        return v
+        return Vector3(*_BASIS[axis])
 
     def convert(self, quaternion: "Quaternion") -> List[List[float]]:
         """Return the Euler angles from the provided quaternion."""
-        if self.is_tait_bryan:
-            return self._tait_bryan(quaternion)
+        return _CONVERTERS[self](self, quaternion)
+
+    def convert_many(self, quaternions: Iterable["Quaternion"]) -> List[List[List[float]]]:
+        """Return the Euler angles from each of the provided quaternions.
 
-        return self._proper(quaternion)
+        The conversion function is resolved once for the whole batch.
+        """
+        converter = _CONVERTERS[self]
+        return [converter(self, quaternion) for quaternion in quaternions]
 
     @property
     def is_tait_bryan(self) -> bool:
         """Return True if these angles are Tait-Bryan angles."""
-        return all(letter in self.name for letter in ["X", "Y", "Z"])
+        return _TAIT_BRYAN[self]
 
     def reverse(self) -> "Axes":
         """Return the reversed order Euler angles."""
-        reversed_name = self.name[::-1]
-        return Axes[reversed_name]
+        return _REVERSED[self]
 
     @property
     def vectors(self) -> List[Vector3]:
         """Return the basis vectors corresponding to the Euler angles axes."""
-        return [Axes.basis_vector(axis.lower()) for axis in self.name]
+        return [Vector3(*components) for components in _VECTORS[self]]
 
     def _proper(self, quaternion: "Quaternion") -> List[List[float]]:
         """Convert the provided unit Quaternion to intrinsic, proper Euler angles.
@@ -70,79 +75,82 @@ class Axes(enum.Enum):
         The function was created by solving each different Euler angle and then looking at the
         pattern although there is probably a nice mathematical basis for this.
         """
+        # Check the squared norm to avoid a square root (which doubles the tolerance near one).
         assert math.isclose(
-            quaternion.norm(), 1, abs_tol=parameters["ASSERT_ABS_TOL"]
+            quaternion.dot(quaternion), 1, abs_tol=2 * parameters["ASSERT_ABS_TOL"]
         ), "The quaternion must be normalized"
 
-        # The indices of the axes used (e.g., YZY => 2, 3).
-        first_letter: int = ord(self.name[0]) - ord("X") + 1
-        second_letter: int = ord(self.name[1]) - ord("X") + 1
-        # The number of axes between first and second letter. Take the modulus so only the forward
-        # direction is considered (e.g., ZX => 1).
-        distance: int = (second_letter - first_letter) % 3
+        # The indices of the first, second, and unused axes (e.g., YZY => 2, 3, 1) and whether the
+        # first and third rotations are swapped, all resolved on import.
+        first_letter, second_letter, missing_letter, swap = _PROPER[self]
 
-        # The axis not used (e.g., YZY => X).
-        missing_letter: int = sum(range(4)) - (first_letter + second_letter)
+        # The components are read once and then indexed by axis.
+        components = (quaternion.r, quaternion.x, quaternion.y, quaternion.z)
+        q0 = components[0]
+        q1 = components[first_letter]
+        q2 = components[second_letter]
+        qm = components[missing_letter]
 
-        a = quaternion[first_letter] * quaternion[second_letter]
-        b = quaternion[0] * quaternion[missing_letter]
-        c = quaternion[0] * quaternion[second_letter]
-        d = quaternion[first_letter] * quaternion[missing_letter]
+        a = q1 * q2
+        b = q0 * qm
+        c = q0 * q2
+        d = q1 * qm
 
         # Use atan instead of acos as atan performs better for very small angle values.
-        cos_beta = 1 - 2 * (quaternion[second_letter] ** 2 + quaternion[missing_letter] ** 2)
-        beta = math.atan2(math.sqrt(1 - cos_beta * cos_beta), cos_beta)
+        cos_beta = 1 - 2 * (q2**2 + qm**2)
+        # Rounding can push the magnitude of the cosine slightly past one so clamp the square of
+        # the sine to zero (where beta is exactly 0 or pi).
+        sin_beta_sq = max(0.0, 1 - cos_beta * cos_beta)
 
-        if math.isclose(beta, 0):
+        if sin_beta_sq == 0 and cos_beta > 0:
             # There is no rotation around the second axis so just compute the rotation around the
             # first axis.
 
             # Determine the polarity of the rotation by checking if the second Euler axis is
-            # parallel or anti-parallel to the axis of rotation. If the dot product is negative, the
-            # vectors are anti-parallel.
-            first_axis = getattr(Vector3, self.name[0].upper())()
-            polarity = -1 if (quaternion.vector * first_axis) < 0 else 1
-            return [[2 * math.acos(quaternion[0]) * polarity, 0, 0]]
-
-        results = []
-        for second in [beta, -beta]:
-            sign = 1 if math.sin(second) > 0 else -1
+            # parallel or anti-parallel to the axis of rotation. The dot product of the first axis
+            # with the quaternion's vector is simply the quaternion's component along that axis.
+            polarity = -1 if q1 < 0 else 1
+            return [[2 * math.acos(min(1.0, max(-1.0, q0))) * polarity, 0, 0]]
 
-            first = math.atan2((a - b) * sign, (c + d) * sign)
-            third = math.atan2((a + b) * sign, (c - d) * sign)
+        beta = math.atan2(math.sqrt(sin_beta_sq), cos_beta)
 
-            # If the rotational axes are adjacent, swap the first and third rotation.
-            if distance % 2 == 1:
-                first, third = third, first
+        # Beta lies in (0, pi] so the sine of the second angle is positive for the first solution
+        # and negative for the second. The signs follow without evaluating the sine.
+        first = math.atan2(a - b, c + d)
+        third = math.atan2(a + b, c - d)
+        first_negative = math.atan2(-(a - b), -(c + d))
+        third_negative = math.atan2(-(a + b), -(c - d))
 
-            results.append([first, second, third])
+        # If the rotational axes are adjacent, swap the first and third rotation.
+        if swap:
+            return [[third, beta, first], [third_negative, -beta, first_negative]]
 
-        return results
+        return [[first, beta, third], [first_negative, -beta, third_negative]]
 
     def _tait_bryan(self, quaternion: "Quaternion") -> List[List[float]]:
         """Convert the provided Quaternion to intrinsic, Tait-Bryant Euler angles.
 
         See the notes in the `Axes._proper` function.
         """
+        # Check the squared norm to avoid a square root (which doubles the tolerance near one).
         assert math.isclose(
-            quaternion.norm(), 1, abs_tol=parameters["ASSERT_ABS_TOL"]
+            quaternion.dot(quaternion), 1, abs_tol=2 * parameters["ASSERT_ABS_TOL"]
         ), "The quaternion must be normalized"
 
-        # The indices of the axes used (e.g., YZX => 2, 3, 1).
-        first_letter: int = ord(self.name[0]) - ord("X") + 1
-        second_letter: int = ord(self.name[1]) - ord("X") + 1
-        third_letter: int = ord(self.name[2]) - ord("X") + 1
-
-        letters = [0, first_letter, second_letter, third_letter]
+        # The indices of the axes used (e.g., YZX => 2, 3, 1) and the sign of the cross terms, all
+        # resolved on import.
+        first_letter, second_letter, third_letter, invert = _TAIT_BRYAN_CONSTANTS[self]
 
-        m = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-        for row_index, i in enumerate(letters):
-            for column_index, j in enumerate(letters):
-                m[row_index][column_index] = 2 * quaternion[i] * quaternion[j]
+        # The quaternion's scalar part followed by its components along each of the axes used.
+        components = (quaternion.r, quaternion.x, quaternion.y, quaternion.z)
+        q0 = components[0]
+        q1 = components[first_letter]
+        q2 = components[second_letter]
+        q3 = components[third_letter]
 
-        invert = 1 if self.name in ["XYZ", "YZX", "ZXY"] else -1
-
-        sin_beta = m[0][2] + (invert * m[1][3])
+        # Each term below is an element of the rotation matrix written as products of the
+        # components (2 * qi * qj) and only the elements which are needed are computed.
+        sin_beta = 2 * q0 * q2 + (invert * (2 * q1 * q3))
 
         if math.isclose(sin_beta, 1) or math.isclose(sin_beta, -1):
             # The first and third axes have been aligned in gimbal lock. This singularity produces
@@ -151,23 +159,69 @@ class Axes(enum.Enum):
                 [
                     0,
                     math.copysign(math.pi / 2, sin_beta),
-                    2 * math.atan2(quaternion[third_letter], quaternion[0]),
+                    2 * math.atan2(q3, q0),
                 ]
             ]
 
         beta = math.asin(sin_beta)
 
-        results = []
-        for second in [beta, math.pi - beta]:
-            sign = 1 if math.cos(second) > 0 else -1
+        first_y = 2 * q0 * q1 - (invert * (2 * q2 * q3))
+        first_x = 1 - (2 * q1 * q1 + 2 * q2 * q2)
+        third_y = 2 * q0 * q3 - (invert * (2 * q1 * q2))
+        third_x = 1 - (2 * q2 * q2 + 2 * q3 * q3)
+
+        # Beta lies in (-pi/2, pi/2) so the cosine of the second angle is positive for the first
+        # solution and negative for the second. The signs follow without evaluating the cosine.
+        return [
+            [math.atan2(first_y, first_x), beta, math.atan2(third_y, third_x)],
+            [math.atan2(-first_y, -first_x), math.pi - beta, math.atan2(-third_y, -third_x)],
+        ]
+
+
+# The quaternion component index of each axis letter for each set of axes (e.g., YZX => 2, 3, 1).
+_LETTERS = {axes: tuple(ord(letter) - ord("X") + 1 for letter in axes.name) for axes in Axes}
+
+# Whether each set of axes uses all three letters (i.e., Tait-Bryan rather than proper angles).
+_TAIT_BRYAN = {axes: all(letter in axes.name for letter in ["X", "Y", "Z"]) for axes in Axes}
+
+
+def _proper_constants(axes: Axes) -> Tuple[int, int, int, bool]:
+    """Return the constants `Axes._proper` needs for the provided proper Euler angles."""
+    first_letter, second_letter, _ = _LETTERS[axes]
+
+    # The axis not used (e.g., YZY => X).
+    missing_letter = sum(range(4)) - (first_letter + second_letter)
+
+    # The number of axes between first and second letter. Take the modulus so only the forward
+    # direction is considered (e.g., ZX => 1). The rotations are swapped for adjacent axes.
+    distance = (second_letter - first_letter) % 3
+
+    return first_letter, second_letter, missing_letter, distance % 2 == 1
+
+
+def _tait_bryan_constants(axes: Axes) -> Tuple[int, int, int, int]:
+    """Return the constants `Axes._tait_bryan` needs for the provided Tait-Bryan angles."""
+    first_letter, second_letter, third_letter = _LETTERS[axes]
+
+    # The cyclic orders (XYZ, YZX, ZXY) step forward by one axis between letters.
+    invert = 1 if (second_letter - first_letter) % 3 == 1 else -1
+
+    return first_letter, second_letter, third_letter, invert
+
+
+# The per axes constants of each conversion, resolved once so the conversions only do arithmetic.
+_PROPER = {axes: _proper_constants(axes) for axes in Axes if not _TAIT_BRYAN[axes]}
+_TAIT_BRYAN_CONSTANTS = {axes: _tait_bryan_constants(axes) for axes in Axes if _TAIT_BRYAN[axes]}
 
-            first = math.atan2(
-                (m[0][1] - (invert * m[2][3])) * sign, (1 - (m[1][1] + m[2][2])) * sign
-            )
-            third = math.atan2(
-                (m[0][3] - (invert * m[1][2])) * sign, (1 - (m[2][2] + m[3][3])) * sign
-            )
+# The conversion function for each set of axes, resolved once so `Axes.convert` does not need to
+# classify the axes on every call.
+# pylint: disable-next=protected-access
+_CONVERTERS = {axes: Axes._tait_bryan if _TAIT_BRYAN[axes] else Axes._proper for axes in Axes}
 
-            results.append([first, second, third])
+# The components of the basis vector for each axis letter. Each call builds a new vector from them.
+_BASIS = {"x": (1, 0, 0), "y": (0, 1, 0), "z": (0, 0, 1)}
 
-        return results
+# The reversed order axes and the components of the basis vectors for each set of axes, resolved
+# once on import.
+_REVERSED = {axes: Axes[axes.name[::-1]] for axes in Axes}
+_VECTORS = {axes: tuple(_BASIS[axis.lower()] for axis in axes.name) for axes in Axes}
@@ -1,5 +1,6 @@
+import math
 from functools import cached_property
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from .aabb import AABB
 from .edge import Edge
@@ -25,18 +26,36 @@ class Facet:
     @cached_property
     def computed_normal(self) -> Vector3:
         """Return a normal computed from the facet's edges."""
+        if len(self.vertices) < 3:
+            raise DegenerateTriangleError("Degenerate triangle found")
+
+        _, _, _, e1x, e1y, e1z, e2x, e2y, e2z = self._components
+
         try:
-            return (self.edges[0].vector % self.edges[1].vector).normalize()
+            return (Vector3(e1x, e1y, e1z) % Vector3(e2x, e2y, e2z)).normalize()
         except ZeroDivisionError:
             raise DegenerateTriangleError("Degenerate triangle found") from ZeroDivisionError
 
     @cached_property
     def edges(self) -> List[Edge]:
         """Return a list of edges."""
-        edges = [Edge(v1, v2) for v1, v2 in zip(self.vertices, self.vertices[1:])]
-        edges.append(Edge(self.vertices[-1], self.vertices[0]))
+        vertices = self.vertices
+        count = len(vertices)
+
+        # Each vertex is joined to the next with the last vertex wrapping around to the first.
+        return [Edge(vertices[index], vertices[(index + 1) % count]) for index in range(count)]
+
+    @cached_property
+    def _components(self) -> Tuple[float, ...]:
+        """Return the first vertex and the two edge vectors leaving it as one flat tuple of floats.
 
-        return edges
+        Ray intersection unpacks all of them at once rather than reading each component from a
+        Vector3. Like the other cached properties, this is computed from the vertices on first use.
+        """
+        v0, v1, v2 = self.vertices[0], self.vertices[1], self.vertices[2]
+        e1, e2 = v1 - v0, v2 - v0
+
+        return (v0.x, v0.y, v0.z, e1.x, e1.y, e1.z, e2.x, e2.y, e2.z)
 
     @property
     def is_triangle(self) -> bool:
@@ -49,37 +68,53 @@ class Facet:
         Returns Intersection.Miss() when the ray origin is in the triangle and the ray points away.
         Returns the ray origin when the ray origin is in the triangle and the ray points towards.
 
-        This function implements the Moller-Trumbore intersection algorithm.
+        This function implements the Moller-Trumbore intersection algorithm (see
+        `_intersect_components`, which is shared with `intersect_many` and `closest_intersection`).
         """
-        E1 = self.edges[0].vector
-        E2 = -self.edges[2].vector
-        P = ray.direction % E2
-
-        det = P * E1
-
-        if not check_back_facing and det < 0:
-            # The ray intersects the back of the triangle
-            return Intersection.Miss()
-
-        try:
-            inv_det = 1 / det
-        except ZeroDivisionError:
-            # The ray is parallel to the triangle
+        direction, origin = ray.direction, ray.origin
+        t = _intersect_components(
+            self._components,
+            direction.x,
+            direction.y,
+            direction.z,
+            origin.x,
+            origin.y,
+            origin.z,
+            check_back_facing,
+        )
+
+        if t == math.inf:
             return Intersection.Miss()
 
-        T = ray.origin - self.vertices[0]
-        Q = T % E1
-
-        u = (P * T) * inv_det
-        v = Q * ray.direction * inv_det
-
-        # Checking if the point of intersection is outside the bounds of the triangle
-        if not (0 <= u <= 1) or (v < 0) or (u + v > 1):
-            return Intersection.Miss()
+        return Intersection(t, self)
 
-        t = Q * E2 / det
+    def intersect_many(
+        self, rays: Iterable[Ray], check_back_facing: bool = False
+    ) -> List[Intersection]:
+        """Return the Intersection of each of the provided rays with the facet.
 
-        return Intersection(t, self)
+        See `Facet.intersect`. The facet's packed components are read once for all of the rays.
+        """
+        components = self._components
+        miss = Intersection.Miss()
+
+        result = []
+        for ray in rays:
+            direction, origin = ray.direction, ray.origin
+            t = _intersect_components(
+                components,
+                direction.x,
+                direction.y,
+                direction.z,
+                origin.x,
+                origin.y,
+                origin.z,
+                check_back_facing,
+            )
+
+            result.append(miss if t == math.inf else Intersection(t, self))
+
+        return result
 
     def scale(self, scale: float = 1) -> "Facet":
         """Return a facet scaled by the provided scale factor."""
@@ -93,3 +128,83 @@ class Facet:
         transformed_vertices = [transform(v, as_type="point") for v in self.vertices]
 
         return Facet(transformed_vertices, transformed_normal)
+
+
+def closest_intersection(
+    facets: Iterable[Facet], ray: Ray, check_back_facing: bool = False
+) -> Intersection:
+    """Return the closest Intersection of the ray with the provided facets.
+
+    This matches the closest result of `Facet.intersect` over the facets but reads the ray once
+    and only constructs an Intersection for the closest facet.
+    """
+    direction, origin = ray.direction, ray.origin
+    dx, dy, dz = direction.x, direction.y, direction.z
+    ox, oy, oz = origin.x, origin.y, origin.z
+
+    closest_t, closest_facet = math.inf, None
+
+    for facet in facets:
+        # pylint: disable-next=protected-access
+        t = _intersect_components(facet._components, dx, dy, dz, ox, oy, oz, check_back_facing)
+
+        if t < closest_t:
+            closest_t, closest_facet = t, facet
+
+    if closest_facet is None:
+        return Intersection.Miss()
+
+    return Intersection(closest_t, closest_facet)
+
+
+# pylint: disable-next=too-many-arguments,too-many-locals
+def _intersect_components(
+    components: Tuple[float, ...],
+    dx: float,
+    dy: float,
+    dz: float,
+    ox: float,
+    oy: float,
+    oz: float,
+    check_back_facing: bool,
+) -> float:
+    """Return the parametric value of the ray's intersection with a facet (or infinity for a miss).
+
+    The facet is given by its packed components (see `Facet._components`) and the ray by the
+    components of its direction and origin.
+
+    This function implements the Moller-Trumbore intersection algorithm. The vector operations are
+    written out component-wise to avoid creating a Vector3 for each intermediate result. Otherwise
+    this follows the usual vector formulation:
+      P = D x E2, det = P . E1, T = O - V0, Q = T x E1, u = P . T / det, v = Q . D / det
+    """
+    v0x, v0y, v0z, e1x, e1y, e1z, e2x, e2y, e2z = components
+
+    px = dy * e2z - dz * e2y
+    py = dz * e2x - dx * e2z
+    pz = dx * e2y - dy * e2x
+
+    det = px * e1x + py * e1y + pz * e1z
+
+    # The ray is parallel to the triangle or intersects the back of it.
+    if det == 0 or (not check_back_facing and det < 0):
+        return math.inf
+
+    inv_det = 1 / det
+    tx, ty, tz = ox - v0x, oy - v0y, oz - v0z
+
+    # Checking if the point of intersection is outside the bounds of the triangle (any NaN fails
+    # the comparisons). The second edge's coordinate is only computed once the first passes.
+    u = (px * tx + py * ty + pz * tz) * inv_det
+    if not 0 <= u <= 1:
+        return math.inf
+
+    qx = ty * e1z - tz * e1y
+    qy = tz * e1x - tx * e1z
+    qz = tx * e1y - ty * e1x
+
+    v = (qx * dx + qy * dy + qz * dz) * inv_det
+    if not (v >= 0 and u + v <= 1):
+        return math.inf
+
+    return (qx * e2x + qy * e2y + qz * e2z) / det
@@ -1,31 +1,43 @@
+import math
 from collections import namedtuple
 from typing import Any, Optional
 
 
 class Intersection(namedtuple("Intersection", "t obj")):
-    """An intersection between a ray and an object."""
+    """An intersection between a ray and an object.
+
+    A miss is represented by an infinite parametric location so that intersections compare by `t`.
+    """
 
     __slots__ = ()
 
     def __new__(cls, t: Optional[float], obj: Optional[Any]):
-        """Construct a new intersection given a parametric location and the intersected object."""
-        if t is not None and t < 0:
+        """Construct a new intersection given a parametric location and the intersected object.
+
+        A parametric location of None is taken to be a miss (i.e., infinite).
+        """
+        if t is None:
+            t = math.inf
+        elif t < 0:
             raise ValueError("Intersection can not be behind ray")
         return super().__new__(cls, t, obj)
 
     @classmethod
     def Miss(cls) -> "Intersection":
-        """Construct a new intersection representing no intersection."""
-        return cls(None, None)
+        """Return an intersection representing no intersection.
+
+        Intersections are immutable so a single miss is shared rather than constructed each time.
+        """
+        return _MISS
 
     @property
     def hit(self) -> bool:
         """Return true if there is a valid intersection location."""
-        return self.t is not None
+        return self.t < math.inf
 
     def closer_than(self, other: "Intersection") -> bool:
         """Return true if this intersection is closer than another Intersection."""
-        if self.t is None:
-            return False
+        return self.t < other.t
+
 
-        return other.t is None or self.t < other.t
+_MISS = Intersection(math.inf, None)
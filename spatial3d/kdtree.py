@@ -1,47 +1,69 @@
-from typing import List, Tuple
+import math
+import operator
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
 
-from .aabb import AABB
+from .aabb import AABB, intersect_ray_aabb
 from .coordinate_axes import CoordinateAxes
-from .facet import Facet
+from .facet import Facet, closest_intersection
 from .intersection import Intersection
 from .ray import Ray
 
 # The deepest level that the KDTree will branch during construction.
 DEPTH_BOUND = 8
 
+# Getters for each component of a vector indexed by axis.
+_COMPONENTS = tuple(operator.attrgetter(name) for name in ("x", "y", "z"))
+
 
 class KDTreeNode:
     """A node of the KDTree which holds a list of facets."""
 
+    __slots__ = ["aabb", "facets", "children", "split_axis", "split_value"]
+
     def __init__(self, aabb: AABB, facets: Facet) -> None:
         self.aabb = aabb
         self.facets = facets
         self.children: List[KDTreeNode] = []
 
+        # The plane the node was split on (only set for interior nodes).
+        self.split_axis: Optional[CoordinateAxes] = None
+        self.split_value: Optional[float] = None
+
     @property
     def is_leaf(self) -> bool:
         """Return true if the this node is a leaf node (i.e., it has no children)."""
         return len(self.children) == 0
 
     def branch(self, depth: int = 0) -> None:
-        """If possible, split the current KDTreeNode into two children nodes."""
-        if not self.can_branch(depth):
-            return
+        """If possible, split the current KDTreeNode into two children nodes.
+
+        The children are then branched in turn until they can no longer be split. The nodes are
+        visited with an explicit stack rather than recursively.
+        """
+        stack = [(self, depth)]
+
+        while stack:
+            node, node_depth = stack.pop()
 
-        splitting_plane = self.splitting_plane(depth)
+            if not node.can_branch(node_depth):
+                continue
 
-        # Create a node for the left and right after splitting.
-        nodes = zip(self.aabb.split(*splitting_plane), self.split_facets(*splitting_plane))
+            splitting_plane = node.splitting_plane(node_depth)
+            node.split_axis, node.split_value = splitting_plane
 
-        for aabb, facets in nodes:
-            node = KDTreeNode(aabb, facets)
-            node.branch(depth + 1)
+            # Create a node for the left and right after splitting.
+            nodes = zip(node.aabb.split(*splitting_plane), node.split_facets(*splitting_plane))
 
-            self.children.append(node)
+            for aabb, facets in nodes:
+                child = KDTreeNode(aabb, facets)
+                node.children.append(child)
 
-        # Interior nodes to the KDTree should not have any facets (only leaf nodes should).
-        # If we've gotten this far, this node is an interior node.
-        self.facets = []
+                stack.append((child, node_depth + 1))
+
+            # Interior nodes to the KDTree should not have any facets (only leaf nodes should).
+            # If we've gotten this far, this node is an interior node.
+            node.facets = []
 
     def can_branch(self, depth: int) -> bool:
         """Return true if this node can be split into two child nodes."""
@@ -52,14 +74,111 @@ class KDTreeNode:
         """Intersect ray with node and return closest found intersection.
 
         Return Intersection.Miss() for no intersections.
+
+        The nodes are visited front to back with an explicit stack rather than recursively. A node
+        is skipped when the ray does not reach its bounding box before the closest hit so far.
+        """
+        origin, inv_direction = ray.origin, ray.inv_direction
+        closest = Intersection.Miss()
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            aabb = node.aabb
+
+            if not intersect_ray_aabb(aabb.min, aabb.max, origin, inv_direction, max_t=closest.t):
+                continue
+
+            if not node.children:
+                x = closest_intersection(node.facets, ray)
+
+                if x.closer_than(closest):
+                    closest = x
+
+                continue
+
+            # Push the far child first so the child on the side the ray travels from is visited
+            # first. If the ray is parallel to the splitting plane, either child may be first.
+            left, right = node.children
+            if ray.direction[node.split_axis] > 0:
+                stack.extend([right, left])
+            else:
+                stack.extend([left, right])
+
+        return closest
+
+    def intersect_many(self, rays: List[Ray]) -> List[Intersection]:
+        """Intersect each ray with the node and return the closest found intersections.
+
+        The rays are traversed together as a packet. A node is skipped for the whole packet when
+        every ray starts beyond one of its faces and points away from it. Otherwise only the rays
+        which reach the node's bounding box before their closest hit so far continue to its
+        children.
         """
-        if not self.aabb.intersect(ray):
-            return Intersection.Miss()
+        if not rays:
+            return []
+
+        closest = [Intersection.Miss()] * len(rays)
+        inv_directions = [ray.inv_direction for ray in rays]
+
+        # The bounds of the packet's origins and directions per axis.
+        origin_bounds = [
+            (min(ray.origin[axis] for ray in rays), max(ray.origin[axis] for ray in rays))
+            for axis in CoordinateAxes
+        ]
+        direction_bounds = [
+            (min(ray.direction[axis] for ray in rays), max(ray.direction[axis] for ray in rays))
+            for axis in CoordinateAxes
+        ]
+
+        stack = [(self, range(len(rays)))]
+
+        while stack:
+            node, active = stack.pop()
+            minimum, maximum = node.aabb.min, node.aabb.max
+
+            if any(
+                (low_origin > maximum[axis] and low_direction >= 0)
+                or (high_origin < minimum[axis] and high_direction <= 0)
+                for axis, (low_origin, high_origin), (low_direction, high_direction) in zip(
+                    CoordinateAxes, origin_bounds, direction_bounds
+                )
+            ):
+                continue
+
+            active = [
+                index
+                for index in active
+                if intersect_ray_aabb(
+                    minimum,
+                    maximum,
+                    rays[index].origin,
+                    inv_directions[index],
+                    max_t=closest[index].t,
+                )
+            ]
 
-        if self.is_leaf:
-            return ray.closest_intersection(self.facets)
+            if not active:
+                continue
 
-        return ray.closest_intersection(self.children)
+            if not node.children:
+                for index in active:
+                    x = closest_intersection(node.facets, rays[index])
+
+                    if x.closer_than(closest[index]):
+                        closest[index] = x
+
+                continue
+
+            # Push the far child (for the first active ray) first so the near child is visited
+            # first and its hits can prune the far child.
+            left, right = node.children
+            if rays[active[0]].direction[node.split_axis] > 0:
+                stack.extend([(right, active), (left, active)])
+            else:
+                stack.extend([(left, active), (right, active)])
+
+        return closest
 
     def split_facets(
         self, plane_axis: CoordinateAxes, plane_value: float
@@ -67,20 +186,111 @@ class KDTreeNode:
         """Split the node's list of facets into left and right lists based on splitting plane."""
         left, right = [], []
 
+        # Plain integer indexing into the bounds is cheaper than going through the enumeration.
+        index = int(plane_axis)
+
         for facet in self.facets:
+            aabb = facet.aabb
+            minimum, maximum = aabb.min[index], aabb.max[index]
+
             # Check minimum bound on left and maximum bound on right.
             # This covers both scenarios: facets belonging to one side only or both sides.
-            if facet.aabb.min[plane_axis] < plane_value:
+            # Facets lying in the splitting plane would belong to neither so keep them on the left.
+            if minimum < plane_value or maximum == plane_value:
                 left.append(facet)
-            if facet.aabb.max[plane_axis] > plane_value:
+            if maximum > plane_value:
                 right.append(facet)
 
         return left, right
 
     def splitting_plane(self, depth: int) -> Tuple[CoordinateAxes, float]:
-        """Return a tuple with the splitting plane axis and value for the given depth."""
-        # TODO: Maybe use a more sophisticated splitting plane generation like SAH.
-        plane_axis = CoordinateAxes(depth % 3)
-        plane_value = self.aabb.center[plane_axis]
+        """Return a tuple with the splitting plane axis and value for the given depth.
+
+        The plane is chosen with the Surface Area Heuristic (SAH). Every facet bounding box face
+        inside the node is a candidate and the one which minimizes the sum of each child's surface
+        area times its number of facets is used. If there are no candidates, the node is split
+        through its center on an axis that cycles with depth.
+        """
+        best_cost, best_plane = math.inf, None
+
+        # The facet bounding box corners are gathered once and then read one component at a time.
+        minimum_corners = [facet.aabb.min for facet in self.facets]
+        maximum_corners = [facet.aabb.max for facet in self.facets]
+
+        for axis in CoordinateAxes:
+            component = _COMPONENTS[axis]
+            cost, value = self._cheapest_plane(
+                axis, list(map(component, minimum_corners)), list(map(component, maximum_corners))
+            )
+
+            # An axis without candidates has no value (and an infinite cost).
+            if value is not None and cost < best_cost:
+                best_cost, best_plane = cost, (axis, value)
+
+        if best_plane is None:
+            plane_axis = CoordinateAxes(depth % 3)
+            return plane_axis, self.aabb.center[plane_axis]
+
+        return best_plane
+
+    def _cheapest_plane(
+        self, axis: CoordinateAxes, minimums: List[float], maximums: List[float]
+    ) -> Tuple[float, Optional[float]]:
+        """Return the lowest SAH cost of the candidate planes on the axis and the plane's value.
+
+        The facets' bounds along the axis are given in facet order. Without any candidates, the
+        cost is infinite and the value is None.
+        """
+        low, high = self.aabb.axis_extents(axis)
+
+        # Half the surface area of a child is the area of its face perpendicular to the axis plus
+        # its length along the axis times the perimeter of that face.
+        size = self.aabb.size
+        first, second = (size[other] for other in CoordinateAxes if other != axis)
+        face_area, perimeter = first * second, first + second
+
+        # Ties keep the lowest value (i.e., the first candidate visited).
+        return min(
+            (
+                (
+                    (face_area + (value - low) * perimeter) * left_count
+                    + (face_area + (high - value) * perimeter) * right_count,
+                    value,
+                )
+                for value, left_count, right_count in _split_counts(minimums, maximums, low, high)
+            ),
+            default=(math.inf, None),
+        )
+
+
+def _split_counts(
+    minimums: List[float], maximums: List[float], low: float, high: float
+) -> Iterator[Tuple[float, int, int]]:
+    """Generate each candidate plane strictly between low and high with its facet counts.
+
+    The facets' bounds along the axis are given in facet order. Each candidate value is generated
+    in increasing order with the number of facets `KDTreeNode.split_facets` puts on its left and on
+    its right.
+    """
+    # Facets lying in a candidate plane are kept on the left by `split_facets` even though their
+    # minimum is not below the plane, so they are counted separately.
+    planar = Counter(minimum for minimum, maximum in zip(minimums, maximums) if minimum == maximum)
+
+    # Sorted facet bounds allow the facets on either side of a plane to be counted in one pass over
+    # the candidates. The candidates are visited in increasing order so the counts are found by
+    # advancing through the sorted bounds rather than searching them.
+    minimums, maximums = sorted(minimums), sorted(maximums)
+    count = len(minimums)
+    left_count = right_start = 0
+
+    for value in sorted(set(minimums + maximums)):
+        # Planes on the boundary of the node do not split it.
+        if not low < value < high:
+            continue
+
+        while left_count < count and minimums[left_count] < value:
+            left_count += 1
+        while right_start < count and maximums[right_start] <= value:
+            right_start += 1
 
-        return plane_axis, plane_value
+        yield value, left_count + planar[value], count - right_start
@@ -1,11 +1,17 @@
 from typing import Iterable
 
-from .dual import Dual
+from .dual import Dual, translation
 from .parameters import parameters
-from .quaternion import Quaternion, conjugate
+from .quaternion import Quaternion, rotation_matrix
 from .transform import Transform
 from .vector3 import Vector3, is_orthonormal_basis
 
+# The elements of the 4 x 4 identity matrix (copied into each identity matrix).
+_IDENTITY_ELEMENTS = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+
+# The default origin of `Matrix4.from_basis` (shared between calls since it is only read).
+_ORIGIN = Vector3()
+
 
 class Matrix4:
     """A column-major 4 x 4 Matrix.
@@ -13,6 +19,8 @@ class Matrix4:
     Elements in groups of four form columns (e.g. self.elements[0:4] is the first column).
     """
 
+    __slots__ = ["elements"]
+
     def __init__(self, elements: Iterable[float] = None) -> None:
         if elements:
             if len(elements) != 16:
@@ -22,7 +30,7 @@ class Matrix4:
 
             self.elements = elements
         else:
-            self.elements = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+            self.elements = list(_IDENTITY_ELEMENTS)
 
     @classmethod
     def from_basis(cls, x: Vector3, y: Vector3, z: Vector3, origin: Vector3 = None):
@@ -31,7 +39,7 @@ class Matrix4:
             x, y, z, tolerance=parameters["ASSERT_ABS_TOL"]
         ), "All basis vectors must be mutually perpendicular and of unit length"
 
-        o = origin or Vector3()
+        o = _ORIGIN if origin is None else origin
         return cls([x.x, x.y, x.z, 0, y.x, y.y, y.z, 0, z.x, z.y, z.z, 0, o.x, o.y, o.z, 1])
 
     @classmethod
@@ -44,15 +52,13 @@ class Matrix4:
         """Construct a matrix from a dual quaternion."""
         assert isinstance(dual.r, Quaternion) and isinstance(dual.d, Quaternion)
 
-        elements = []
-
-        for basis in [Vector3.X(), Vector3.Y(), Vector3.Z()]:
-            elements.extend([*dual.r.rotate(basis), 0])
+        # The images of the basis vectors are the columns of the rotation matrix.
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = rotation_matrix(dual.r)
 
-        translation = 2 * dual.d * conjugate(dual.r)
-        elements.extend([*translation.xyz, 1])
+        # The translation is computed as in `Transform.translation` without creating a Transform.
+        tx, ty, tz = translation(dual)
 
-        return cls(elements)
+        return cls([m00, m10, m20, 0, m01, m11, m21, 0, m02, m12, m22, 0, tx, ty, tz, 1])
 
     def __getitem__(self, index: int) -> float:
         """Return the value of the matrix at the provided index."""
@@ -60,10 +66,11 @@ class Matrix4:
 
     def __str__(self) -> str:
         """Return the string representation of this matrix."""
-        # Get the width of "widest" floating point number
-        longest = max(map(len, map(lambda e: f"{e:.4f}", self.elements)))
+        # Format each element once and get the width of the "widest" floating point number
+        formatted = [f"{element:.4f}" for element in self.elements]
+        longest = max(map(len, formatted))
         # Pad the left of each element to the widest number found
-        padded = list(map(lambda elem: f"{elem:>{longest}.4f}", self.elements))
+        padded = [string.rjust(longest) for string in formatted]
 
         # Since the values are stored column-major, we need to "transpose"
         columns = [padded[i : i + 4] for i in range(0, 15, 4)]
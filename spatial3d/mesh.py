@@ -1,12 +1,26 @@
-from typing import Generator, List
+import itertools
+from typing import Iterable, Iterator, List
 
 from .aabb import AABB
-from .facet import Facet
+from .facet import Facet, closest_intersection
 from .intersection import Intersection
 from .kdtree import KDTreeNode
 from .ray import Ray
 from .transform import Transform
-from .vector3 import Vector3
+from .vector3 import _COMPONENTS, Vector3
+
+
+def _group_by_facet(vertices: List[Vector3], facets: Iterable[Facet]) -> Iterator[List[Vector3]]:
+    """Generate the slice of the flat list of vertices belonging to each of the provided facets.
+
+    The vertices are in the order of `Mesh.vertices`. Facets are not necessarily triangles so each
+    slice is as long as the facet's own list of vertices.
+    """
+    start = 0
+    for facet in facets:
+        end = start + len(facet.vertices)
+        yield vertices[start:end]
+        start = end
 
 
 class Mesh:
@@ -15,13 +29,16 @@ class Mesh:
     def __init__(self, name: str = None, facets: List[Facet] = None):
         self.name = name
         self.facets = facets or []
-        self.aabb = AABB()
 
-        for facet in self.facets:
-            self.aabb.expand(facet.vertices)
+        # The bounding box is only expanded to fit new facets once it is requested.
+        self._aabb = AABB()
+        self._unbounded_facets: List[Facet] = list(self.facets)
 
         self._accelerator = None
 
+        # Adding facets only marks the accelerator as stale. It is rebuilt once, when next used.
+        self._accelerator_stale = False
+
     @classmethod
     def from_file(cls, file_parser: object, file_path: str) -> "Mesh":
         """Construct a mesh from a file."""
@@ -34,9 +51,40 @@ class Mesh:
 
         return meshes
 
+    @classmethod
+    def _from_bounded_facets(cls, name: str, facets: List[Facet], aabb: AABB) -> "Mesh":
+        """Construct a mesh from facets and a bounding box already known to bound all of them.
+
+        The bounding box is used as is (not copied or checked) so the facets are never rescanned.
+        """
+        mesh = cls(name, facets)
+        mesh._aabb = aabb
+        mesh._unbounded_facets = []
+
+        return mesh
+
+    @property
+    def aabb(self) -> AABB:
+        """Return the mesh's axis aligned bounding box."""
+        if self._unbounded_facets:
+            # Bound the new vertices as one flat list so their extremes are found a coordinate at a
+            # time rather than by expanding the bounding box with each vertex in turn.
+            vertices = list(
+                itertools.chain.from_iterable(facet.vertices for facet in self._unbounded_facets)
+            )
+            self._aabb.expand(AABB(vertices))
+            self._unbounded_facets = []
+
+        return self._aabb
+
     @property
     def accelerator(self) -> object:
-        """Return the spatial accelerator used."""
+        """Return the spatial accelerator used, rebuilding it first if facets have been added."""
+        if self._accelerator_stale:
+            self._accelerator_stale = False
+            # Reinitialize the accelerator by passing its type to the setter.
+            self.accelerator = type(self._accelerator)
+
         return self._accelerator
 
     @accelerator.setter
@@ -44,24 +92,42 @@ class Mesh:
         """Set the spatial accelerator used."""
         self._accelerator = accelerator(self.aabb, self.facets)
         self._accelerator.branch()
+        self._accelerator_stale = False
 
     @property
-    def vertices(self) -> Generator[Vector3, None, None]:
-        """Generate list of mesh vertices returned grouped by facet."""
-        for facet in self.facets:
-            yield facet.vertices[0]
-            yield facet.vertices[1]
-            yield facet.vertices[2]
+    def vertices(self) -> Iterator[Vector3]:
+        """Generate list of mesh vertices returned grouped by facet.
+
+        Every vertex of each facet is generated so a facet that is not a triangle contributes more
+        (or fewer) than three vertices.
+        """
+        # Chaining the facets' vertex lists iterates at C speed rather than resuming a generator
+        # for each vertex.
+        return itertools.chain.from_iterable(facet.vertices for facet in self.facets)
 
     def append(self, facet: Facet) -> None:
-        """Add a facet to the mesh."""
-        self.aabb.expand(facet.vertices)
+        """Add a facet to the mesh.
+
+        The accelerator is not rebuilt until it is next used so a run of appends only costs a single
+        rebuild.
+        """
+        self._unbounded_facets.append(facet)
 
         self.facets.append(facet)
 
-        if self.accelerator:
-            # Reinitialize the accelerator by passing its type to the setter.
-            self.accelerator = type(self.accelerator)
+        if self._accelerator:
+            self._accelerator_stale = True
+
+    def extend(self, facets: Iterable[Facet]) -> None:
+        """Add each of the provided facets to the mesh."""
+        facets = list(facets)
+
+        self._unbounded_facets.extend(facets)
+
+        self.facets.extend(facets)
+
+        if self._accelerator:
+            self._accelerator_stale = True
 
     def intersect(self, local_ray: Ray) -> Intersection:
         """Return the closest intersection between the ray and mesh.
@@ -71,17 +137,57 @@ class Mesh:
         if self.accelerator:
             return self.accelerator.intersect(local_ray)
 
-        # Otherwise we brute force the computation.
-        return local_ray.closest_intersection(self.facets)
+        # Otherwise we brute force the computation with a single pass over the facets that only
+        # constructs an Intersection for the closest one.
+        return closest_intersection(self.facets, local_ray)
+
+    def intersect_many(self, local_rays: Iterable[Ray]) -> List[Intersection]:
+        """Return the closest intersection between each of the provided rays and the mesh.
+
+        See `Mesh.intersect`.
+        """
+        if self.accelerator:
+            return self.accelerator.intersect_many(list(local_rays))
+
+        facets = self.facets
+        return [closest_intersection(facets, local_ray) for local_ray in local_rays]
 
     def scale(self, scale: float = 1.0) -> "Mesh":
         """Return a mesh scaled about the origin by the provided factor."""
-        transformed_facets = [facet.scale(scale) for facet in self.facets]
+        # Scale the flat list of vertices in one pass rather than facet by facet.
+        vertices = [
+            Vector3(scale * x, scale * y, scale * z) for x, y, z in map(_COMPONENTS, self.vertices)
+        ]
 
-        return Mesh(self.name, transformed_facets)
+        # Scaling does not change the direction of the normals. See `Facet.scale`.
+        transformed_facets = [
+            Facet(facet_vertices, facet.computed_normal)
+            for facet_vertices, facet in zip(_group_by_facet(vertices, self.facets), self.facets)
+        ]
+
+        aabb = self.aabb
+        if aabb.is_empty:
+            return Mesh(self.name, transformed_facets)
+
+        # Scaling each coordinate is monotonic (and exact in its rounding) so the scaled corners
+        # bound the scaled vertices exactly. A negative factor swaps which corner is the minimum.
+        scaled_aabb = AABB([scale * aabb.min, scale * aabb.max])
+
+        return Mesh._from_bounded_facets(self.name, transformed_facets, scaled_aabb)
 
     def transform(self, transform: Transform) -> "Mesh":
         """Return a mesh transformed by the provided transform."""
-        transformed_facets = [facet.transform(transform) for facet in self.facets]
-
-        return Mesh(self.name, transformed_facets)
+        # Transform every vertex and normal in two batches rather than facet by facet.
+        vertices = transform.transform_many(self.vertices, as_type="point")
+        normals = transform.transform_many(
+            (facet.normal for facet in self.facets), as_type="vector"
+        )
+
+        transformed_facets = [
+            Facet(facet_vertices, normal)
+            for facet_vertices, normal in zip(_group_by_facet(vertices, self.facets), normals)
+        ]
+
+        # Bound the transformed vertices while they are still in one flat list rather than
+        # gathering them from the facets again when the bounding box is requested.
+        return Mesh._from_bounded_facets(self.name, transformed_facets, AABB(vertices))
@@ -1,11 +1,21 @@
 import math
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 from .euler import Axes, Order
 from .parameters import parameters
 from .swizzler import Swizzler
 from .vector3 import Vector3, is_orthonormal_basis
 
+# The dot product above which `slerp` falls back to a normalized linear interpolation.
+SLERP_LINEAR_THRESHOLD = 0.9995
+
+# The components of the positive and negative basis vectors. These are already unit length.
+_BASIS_AXES = frozenset([(1, 0, 0), (0, 1, 0), (0, 0, 1), (-1, 0, 0), (0, -1, 0), (0, 0, -1)])
+
+# The names of the components in index order.
+_COMPONENT_NAMES = ("r", "x", "y", "z")
+
 
 class Quaternion(Swizzler):
     """A quaternion of the form r + xi + yj + zk."""
@@ -20,7 +30,14 @@ class Quaternion(Swizzler):
 
     @classmethod
     def from_axis_angle(cls, axis: Vector3, angle: float) -> "Quaternion":
-        """Construct a quaternion from an axis and angle (in radians)."""
+        """Construct a quaternion from an axis and angle (in radians).
+
+        Rotations about the basis axes are common (e.g., Euler angles) so they are memoized.
+        """
+        components = (axis.x, axis.y, axis.z)
+        if components in _BASIS_AXES:
+            return cls(*_basis_axis_angle(*components, angle))
+
         half_angle = angle / 2
         try:
             axis = math.sin(half_angle) * axis.normalize()
@@ -58,16 +75,27 @@ class Quaternion(Swizzler):
     @classmethod
     def from_euler(cls, angles: List[float], axes: Axes, order: Order) -> "Quaternion":
         """Construct a quaternion from euler angles (in radians)."""
-        quaternion = cls()
-
         if order == Order.EXTRINSIC:
             angles.reverse()
             axes = axes.reverse()
 
-        for axis, angle in zip(axes.vectors, angles):
-            quaternion *= cls.from_axis_angle(axis=axis, angle=angle)
+        # Compose the rotation about each axis in turn. Multiplying by a rotation about a basis
+        # axis, (c, s * axis), only involves two terms per component so the products are written
+        # out directly rather than creating a quaternion for each axis.
+        r, x, y, z = 1, 0, 0, 0
 
-        return quaternion
+        for axis, angle in zip(axes.name, angles):
+            half_angle = angle / 2
+            c, s = math.cos(half_angle), math.sin(half_angle)
+
+            if axis == "X":
+                r, x, y, z = r * c - x * s, x * c + r * s, y * c + z * s, z * c - y * s
+            elif axis == "Y":
+                r, x, y, z = r * c - y * s, x * c - z * s, y * c + r * s, z * c + x * s
+            else:
+                r, x, y, z = r * c - z * s, x * c + y * s, y * c - x * s, z * c + r * s
+
+        return cls(r, x, y, z)
 
     @classmethod
     def from_vector(cls, vector: Vector3) -> "Quaternion":
@@ -108,8 +136,7 @@ class Quaternion(Swizzler):
 
     def __getitem__(self, index: int) -> float:
         """Return the value of the component at the provided index."""
-        components = ["r", "x", "y", "z"]
-        return getattr(self, components[index])
+        return (self.r, self.x, self.y, self.z)[index]
 
     def __mul__(self, other: Union[float, int, "Quaternion"]) -> "Quaternion":
         """Quaternion multiplication.
@@ -117,16 +144,21 @@ class Quaternion(Swizzler):
         If passed a number, scalar multiplication is performed.
         If passed another quaternion, quaternion multiplication is performed.
         """
-        if isinstance(other, (float, int)):
-            return Quaternion(self.r * other, self.x * other, self.y * other, self.z * other)
-
+        # Check for a quaternion first since quaternion products dominate rotations.
         if isinstance(other, Quaternion):
-            r = self.r * other.r - self.x * other.x - self.y * other.y - self.z * other.z
-            x = self.r * other.x + self.x * other.r + self.y * other.z - self.z * other.y
-            y = self.r * other.y - self.x * other.z + self.y * other.r + self.z * other.x
-            z = self.r * other.z + self.x * other.y - self.y * other.x + self.z * other.r
+            # Read each component once rather than once per term.
+            ar, ax, ay, az = self.r, self.x, self.y, self.z
+            br, bx, by, bz = other.r, other.x, other.y, other.z
+
+            return Quaternion(
+                ar * br - ax * bx - ay * by - az * bz,
+                ar * bx + ax * br + ay * bz - az * by,
+                ar * by - ax * bz + ay * br + az * bx,
+                ar * bz + ax * by - ay * bx + az * br,
+            )
 
-            return Quaternion(r, x, y, z)
+        if isinstance(other, (float, int)):
+            return Quaternion(self.r * other, self.x * other, self.y * other, self.z * other)
 
         return NotImplemented
 
@@ -147,12 +179,12 @@ class Quaternion(Swizzler):
 
     def __setitem__(self, index: int, value: float) -> None:
         """Set the value of the component at the provided index."""
-        components = ["r", "x", "y", "z"]
-        setattr(self, components[index], value)
+        setattr(self, _COMPONENT_NAMES[index], value)
 
     def __str__(self) -> str:
         """Return the string representation of this quaternion."""
-        return format(self, "")
+        # The same as `format(self, "")` without going through __format__ and its nested specs.
+        return f"({self.r}, {self.x}, {self.y}, {self.z})"
 
     def __sub__(self, other: "Quaternion") -> "Quaternion":
         """Return a quaternion with the component-wise difference of this and the other."""
@@ -190,21 +222,49 @@ class Quaternion(Swizzler):
     # TODO: I need to make the naming consistent across all objects (i.e., I use length in Vector3)
     def norm(self) -> float:
         """Return the length of the quaternion."""
-        return math.sqrt(self.r**2 + self.x**2 + self.y**2 + self.z**2)
+        return math.sqrt(self.r * self.r + self.x * self.x + self.y * self.y + self.z * self.z)
 
     def normalize(self) -> "Quaternion":
         """Normalize the quaternion instance (i.e. norm of one)."""
-        norm = self.norm()
-        self.r /= norm
-        self.x /= norm
-        self.y /= norm
-        self.z /= norm
+        # Multiply by the reciprocal to trade four divisions for one.
+        inverse_norm = 1 / self.norm()
+        self.r *= inverse_norm
+        self.x *= inverse_norm
+        self.y *= inverse_norm
+        self.z *= inverse_norm
         return self
 
     def rotate(self, vector: Vector3) -> Vector3:
         """Return the provided vector rotated by this quaternion."""
-        result = self * Quaternion.from_vector(vector) * conjugate(self)
-        return Vector3(*result.xyz)
+        # This is the product q * v * conjugate(q) written out so no intermediate quaternions are
+        # created. The terms of v's zero scalar part are dropped.
+        r, x, y, z = self.r, self.x, self.y, self.z
+        vx, vy, vz = vector.x, vector.y, vector.z
+
+        # The product t = q * v.
+        tr = -x * vx - y * vy - z * vz
+        tx = r * vx + y * vz - z * vy
+        ty = r * vy - x * vz + z * vx
+        tz = r * vz + x * vy - y * vx
+
+        # The vector part of the product t * conjugate(q).
+        return Vector3(
+            tx * r - tr * x - ty * z + tz * y,
+            tx * z - tr * y + ty * r - tz * x,
+            -tr * z - tx * y + ty * x + tz * r,
+        )
+
+
+@lru_cache(maxsize=256)
+def _basis_axis_angle(x: float, y: float, z: float, angle: float) -> Tuple[float, ...]:
+    """Return the components of the rotation about a (unit length) basis axis.
+
+    The result matches `Quaternion.from_axis_angle` since normalizing a basis axis changes nothing.
+    """
+    half_angle = angle / 2
+    sine = math.sin(half_angle)
+
+    return (math.cos(half_angle), sine * x, sine * y, sine * z)
 
 
 def conjugate(q: Quaternion) -> Quaternion:
@@ -212,6 +272,24 @@ def conjugate(q: Quaternion) -> Quaternion:
     return Quaternion(q.r, -q.x, -q.y, -q.z)
 
 
+def rotation_matrix(
+    q: Quaternion,
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]]:
+    """Return the rows of the 3 x 3 matrix which rotates vectors like `Quaternion.rotate`.
+
+    The matrix is equal to the product q * v * conjugate(q) so a non-unit quaternion also scales.
+    """
+    rr, xx, yy, zz = q.r * q.r, q.x * q.x, q.y * q.y, q.z * q.z
+    xy, xz, yz = q.x * q.y, q.x * q.z, q.y * q.z
+    rx, ry, rz = q.r * q.x, q.r * q.y, q.r * q.z
+
+    return (
+        (rr + xx - yy - zz, 2 * (xy - rz), 2 * (xz + ry)),
+        (2 * (xy + rz), rr - xx + yy - zz, 2 * (yz - rx)),
+        (2 * (xz - ry), 2 * (yz + rx), rr - xx - yy + zz),
+    )
+
+
 def slerp(q1: Quaternion, q2: Quaternion, alpha: float, shortest_path: bool = True) -> Quaternion:
     """Return the spherical linear interpolation between q1 and q2.
 
@@ -228,15 +306,22 @@ def slerp(q1: Quaternion, q2: Quaternion, alpha: float, shortest_path: bool = Tr
     # negative.
     if dot < 0 and shortest_path:
         q2 = -q2
-        dot = q1.dot(q2)
+        dot = -dot
 
     # If the dot is 1 or -1, then theta is zero and the starting point should be returned.
     if dot >= 1 or dot <= -1:
         return q1
 
-    # Compute the half angle between the two quaternions and scale based on the parameter.
-    theta = alpha * math.acos(dot)
+    # Nearly parallel quaternions are indistinguishable from their normalized linear interpolation
+    # which avoids the trigonometric functions entirely.
+    if dot > SLERP_LINEAR_THRESHOLD:
+        return (q1 * (1 - alpha) + q2 * alpha).normalize()
+
+    # Compute the half angle between the two quaternions and weight each by the parameter.
+    sin_theta = math.sqrt(1 - dot * dot)
+    theta = math.atan2(sin_theta, dot)
 
-    q = (q2 - (q1 * dot)).normalize()
+    first = math.sin((1 - alpha) * theta) / sin_theta
+    second = math.sin(alpha * theta) / sin_theta
 
-    return q1 * math.cos(theta) + q * math.sin(theta)
+    return q1 * first + q2 * second
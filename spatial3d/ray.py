@@ -1,5 +1,6 @@
 from typing import Iterable
 
+from .aabb import inverse_direction
 from .intersection import Intersection
 from .transform import Transform
 from .vector3 import Vector3
@@ -8,6 +9,8 @@ from .vector3 import Vector3
 class Ray:
     """A ray given an origin and a direction vector."""
 
+    __slots__ = ["origin", "_direction", "inv_direction"]
+
     def __init__(self, origin: Vector3, direction: Vector3) -> None:
         self.origin = origin
         try:
@@ -15,6 +18,20 @@ class Ray:
         except ZeroDivisionError:
             raise ValueError("The direction vector must be non-zero") from ZeroDivisionError
 
+    @property
+    def direction(self) -> Vector3:
+        """Return the direction of the ray."""
+        return self._direction
+
+    @direction.setter
+    def direction(self, direction: Vector3) -> None:
+        """Set the direction of the ray along with its component-wise reciprocal."""
+        self._direction = direction
+
+        # Bounding box slab tests divide by the direction so compute the reciprocal once per ray
+        # rather than once per box visited.
+        self.inv_direction = inverse_direction(direction)
+
     def __str__(self) -> str:
         """Return the string representation of this ray."""
         return f"{self.origin} + t * {self.direction}"
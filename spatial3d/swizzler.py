@@ -1,7 +1,25 @@
 # This class is meant to be inherited from so the lack of public methods is normal.
 # pylint: disable=too-few-public-methods
 
-from typing import Any, List
+import operator
+from itertools import product
+from typing import Any, Callable, Dict, List, Tuple
+
+# The longest compositions installed on each subclass as properties when it is defined.
+_PRECOMPUTED_LENGTH = 4
+
+# Getters for the longer compositions accessed so far, keyed by class and composition.
+_GETTERS: Dict[Tuple[type, str], Callable[[Any], Any]] = {}
+
+
+def _swizzle_property(name: str) -> property:
+    """Return a read-only property with the values of the parameters composed in `name`."""
+    getter = operator.attrgetter(*name)
+
+    def values(self: Any) -> List[Any]:
+        return list(getter(self))
+
+    return property(values)
 
 
 class Swizzler:
@@ -13,6 +31,21 @@ class Swizzler:
     See Vector3 and Quaternion.
     """
 
+    # An empty slots declaration keeps the subclasses' slots effective (i.e., without a __dict__).
+    __slots__ = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Install a property for each short composition of the subclass's parameters."""
+        super().__init_subclass__(**kwargs)
+
+        parameters = [slot for slot in vars(cls).get("__slots__", []) if len(slot) == 1]
+
+        # Single parameters are left out since a property would replace the slot.
+        for length in range(2, _PRECOMPUTED_LENGTH + 1):
+            for name in map("".join, product(parameters, repeat=length)):
+                if not hasattr(cls, name):
+                    setattr(cls, name, _swizzle_property(name))
+
     def __getattr__(self, name: str) -> List[Any]:
         """Return a list of values of the composed parameters.
 
@@ -20,12 +53,17 @@ class Swizzler:
 
         This function raises an AttributeError if the parameter does not exist.
         """
+        # Short compositions are properties and never reach this method. A single parameter only
+        # gets here if its slot has not been set.
+        key = (type(self), name)
 
-        def allow(char: str) -> Any:
-            """Return the value of the provided parameter."""
-            if char not in self.__slots__:
-                raise AttributeError
+        try:
+            getter = _GETTERS[key]
+        except KeyError:
+            # Validate the composition once and then reuse a single getter for every access.
+            if len(name) < 2 or any(char not in self.__slots__ for char in name):
+                raise AttributeError(name) from None
 
-            return getattr(self, char)
+            getter = _GETTERS[key] = operator.attrgetter(*name)
 
-        return list(map(allow, name))
+        return list(getter(self))
@@ -1,4 +1,5 @@
-from typing import Iterable, Tuple, Union
+from itertools import repeat
+from typing import Iterable, List, Tuple, Union
 
 from . import dual, quaternion
 from .vector3 import Vector3
@@ -6,6 +7,12 @@ from .vector3 import Vector3
 Quaternion = quaternion.Quaternion
 Dual = dual.Dual
 
+# A shared zero vector used for omitted arguments. It is only read and never modified.
+_ZERO = Vector3()
+
+# Shared basis vectors for the axis properties. Like `_ZERO`, these are only read.
+_X_AXIS, _Y_AXIS, _Z_AXIS = Vector3.X(), Vector3.Y(), Vector3.Z()
+
 
 class Transform:
     """Spatial rigid body transformation in three dimensions."""
@@ -24,8 +31,8 @@ class Transform:
         cls, axis: Vector3 = None, angle: float = 0, translation: Vector3 = None
     ) -> "Transform":
         """Create a transform from axis, angle, and translation components."""
-        axis = axis or Vector3()
-        translation = translation or Vector3()
+        axis = _ZERO if axis is None else axis
+        translation = _ZERO if translation is None else translation
 
         return cls.from_orientation_translation(
             Quaternion.from_axis_angle(axis, angle), translation
@@ -36,14 +43,31 @@ class Transform:
         cls, orientation: Quaternion, translation: Vector3 = None
     ) -> "Transform":
         """Create a transform from orientation and translation."""
-        translation = translation or Vector3()
-        return cls(Dual(orientation, 0.5 * Quaternion.from_vector(translation) * orientation))
+        translation = _ZERO if translation is None else translation
+
+        # The dual part is 0.5 * t * r where t is the translation as a pure quaternion. With the
+        # real part of t being zero, the product is written out with the zero terms dropped.
+        tx, ty, tz = 0.5 * translation.x, 0.5 * translation.y, 0.5 * translation.z
+        r, x, y, z = orientation.r, orientation.x, orientation.y, orientation.z
+
+        d = Quaternion(
+            -tx * x - ty * y - tz * z,
+            tx * r + ty * z - tz * y,
+            -tx * z + ty * r + tz * x,
+            tx * y - ty * x + tz * r,
+        )
+
+        return cls(Dual(orientation, d))
 
     def __call__(
         self, vector: Union[Iterable[Vector3], Vector3], as_type: str = "point"
     ) -> Union[Iterable[Vector3], Vector3]:
         """Apply this transform to a vector with call syntax."""
         if isinstance(vector, (list, tuple)):
+            # A flat collection of vectors is transformed as one batch.
+            if all(map(isinstance, vector, repeat(Vector3))):
+                return self.transform_many(vector, as_type)
+
             return [self.__call__(item, as_type) for item in vector]
 
         if not isinstance(vector, Vector3):
@@ -73,9 +97,8 @@ class Transform:
     @property
     def translation(self) -> Vector3:
         """Return the transform's translation vector."""
-        # "Undo" what was done in the __init__ function by working backwards
-        t = 2 * self.dual.d * quaternion.conjugate(self.dual.r)
-        return t.vector
+        # "Undo" what was done in the __init__ function. See `dual.translation`.
+        return Vector3(*dual.translation(self.dual))
 
     @property
     def x_axis(self) -> Vector3:
@@ -84,7 +107,7 @@ class Transform:
         If the transformation is interpreted as a coordinate frame, this is the X axis of the
         transformed coordinate frame.
         """
-        return self.transform(Vector3.X(), as_type="vector")
+        return self.transform(_X_AXIS, as_type="vector")
 
     @property
     def y_axis(self) -> Vector3:
@@ -93,7 +116,7 @@ class Transform:
         If the transformation is interpreted as a coordinate frame, this is the Y axis of the
         transformed coordinate frame.
         """
-        return self.transform(Vector3.Y(), as_type="vector")
+        return self.transform(_Y_AXIS, as_type="vector")
 
     @property
     def z_axis(self) -> Vector3:
@@ -102,7 +125,7 @@ class Transform:
         If the transformation is interpreted as a coordinate frame, this is the Z axis of the
         transformed coordinate frame.
         """
-        return self.transform(Vector3.Z(), as_type="vector")
+        return self.transform(_Z_AXIS, as_type="vector")
 
     def inverse(self) -> "Transform":
         """Return a the inverse of this transform."""
@@ -113,13 +136,41 @@ class Transform:
 
         Optionally treat the vector as a point and apply to its position.
         """
-        q = Quaternion.from_vector(vector)
         if as_type == "vector":
             return self.dual.r.rotate(vector)
 
         if as_type == "point":
-            d = Dual(Quaternion(), q)
-            a = self.dual * d * dual.conjugate(self.dual)
-            return a.d.vector
+            # Expanding the dual quaternion sandwich product for a point gives its rotation plus
+            # the translation so neither the point's dual nor the conjugate need to be created.
+            # The rotated vector is new so the translation is added to it in place.
+            rotated = self.dual.r.rotate(vector)
+            tx, ty, tz = dual.translation(self.dual)
+
+            rotated.x += tx
+            rotated.y += ty
+            rotated.z += tz
+
+            return rotated
 
         raise KeyError(f"Unknown transform type: {as_type}")
+
+    def transform_many(self, vectors: Iterable[Vector3], as_type: str = "point") -> List[Vector3]:
+        """Apply the transform to each of the provided vectors.
+
+        The results are identical to calling `Transform.transform` on each vector.
+        """
+        if as_type not in ("point", "vector"):
+            raise KeyError(f"Unknown transform type: {as_type}")
+
+        # Rotate with the same arithmetic as `Transform.transform` so batches round identically.
+        rotated = list(map(self.dual.r.rotate, vectors))
+
+        if as_type == "point":
+            tx, ty, tz = dual.translation(self.dual)
+
+            for vector in rotated:
+                vector.x += tx
+                vector.y += ty
+                vector.z += tz
+
+        return rotated
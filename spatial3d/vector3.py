@@ -1,11 +1,18 @@
 import math
-from typing import Optional, Union, overload
+import operator
+from typing import Iterable, List, Optional, Union, overload
 
 from spatial3d import parameters
 
 from .parameters import parameters
 from .swizzler import Swizzler
 
+# The names of the components in index order.
+_COMPONENT_NAMES = ("x", "y", "z")
+
+# Read all three components of a vector in one call (e.g., in batches of vectors).
+_COMPONENTS = operator.attrgetter(*_COMPONENT_NAMES)
+
 
 class Vector3(Swizzler):
     """A 3D Vector."""
@@ -63,8 +70,16 @@ class Vector3(Swizzler):
 
     def __getitem__(self, index: int) -> float:
         """Return the value of the component at the provided index."""
-        components = ["x", "y", "z"]
-        return getattr(self, components[index])
+        # Compare against each index rather than building a sequence to index into on every call.
+        if index == 0:
+            return self.x
+        if index == 1:
+            return self.y
+        if index == 2:
+            return self.z
+
+        # Fall back to tuple indexing for negative indices (and the IndexError when out of range).
+        return (self.x, self.y, self.z)[index]
 
     def __len__(self) -> int:
         """Return the number of (coordinate) dimensions in this vector."""
@@ -72,7 +87,12 @@ class Vector3(Swizzler):
 
     def __mod__(self, other: "Vector3") -> "Vector3":
         """Return the cross product of this vector with the other."""
-        return cross(self, other)
+        # Written out rather than calling `cross` to save a function call in intersection tests.
+        return Vector3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
 
     @overload
     def __mul__(self, other: "Vector3") -> float:  # noqa: D105
@@ -87,13 +107,14 @@ class Vector3(Swizzler):
 
         If `other` is a scalar, return a vector with the component-wise multiple of this vector.
         """
-        if isinstance(other, (float, int)):
-            return Vector3(other * self.x, other * self.y, other * self.z)
-
+        # Check for a vector first since dot products dominate the geometric tests.
         if isinstance(other, Vector3):
             # Dot product
             return self.x * other.x + self.y * other.y + self.z * other.z
 
+        if isinstance(other, (float, int)):
+            return Vector3(other * self.x, other * self.y, other * self.z)
+
         return NotImplemented
 
     def __neg__(self) -> "Vector3":
@@ -112,12 +133,20 @@ class Vector3(Swizzler):
 
     def __setitem__(self, index: int, value: float) -> None:
         """Set the value of the component at the provided index."""
-        components = ["x", "y", "z"]
-        setattr(self, components[index], value)
+        if index == 0:
+            self.x = value
+        elif index == 1:
+            self.y = value
+        elif index == 2:
+            self.z = value
+        else:
+            # Fall back to the names for negative indices (and the IndexError when out of range).
+            setattr(self, _COMPONENT_NAMES[index], value)
 
     def __str__(self) -> str:
         """Return the string representation of this vector."""
-        return format(self, "")
+        # The same as `format(self, "")` without going through __format__ and its nested specs.
+        return f"({self.x}, {self.y}, {self.z})"
 
     def __sub__(self, other: "Vector3") -> "Vector3":
         """Return a vector with the component-wise difference of this vector and the other."""
@@ -146,21 +175,21 @@ class Vector3(Swizzler):
 
     def length(self) -> float:
         """Return the length of the vector."""
-        return math.sqrt(self.length_sq())
+        return math.hypot(self.x, self.y, self.z)
 
     def length_sq(self) -> float:
         """Return the squared length of the vector."""
-        return self.x**2 + self.y**2 + self.z**2
+        return self.x * self.x + self.y * self.y + self.z * self.z
 
     def normalize(self) -> "Vector3":
         """Normalize this vector to unit length.
 
         This function will raise an exception if the vector has zero length.
         """
-        length = self.length()
-        self.x /= length
-        self.y /= length
-        self.z /= length
+        reciprocal = 1 / self.length()
+        self.x *= reciprocal
+        self.y *= reciprocal
+        self.z *= reciprocal
         return self
 
 
@@ -168,17 +197,71 @@ def almost_equal(v1: Vector3, v2: Vector3, tolerance: Optional[float] = None) ->
     """Return True if two vectors are equal within a given tolerance."""
     tolerance = tolerance or parameters["ABS_TOL"]
 
-    difference = v1 - v2
+    # The squared distance is written out rather than creating the difference vector. Being non
+    # negative, it is close to zero exactly when it is within the tolerance.
+    dx, dy, dz = v1.x - v2.x, v1.y - v2.y, v1.z - v2.z
+
+    return dx * dx + dy * dy + dz * dz <= tolerance
+
+
+def almost_equal_many(
+    v1s: Iterable[Vector3], v2s: Iterable[Vector3], tolerance: Optional[float] = None
+) -> List[bool]:
+    """Return whether each pair of vectors is equal within a given tolerance.
+
+    See `almost_equal`. The tolerance is looked up once rather than once per pair.
+    """
+    tolerance = tolerance or parameters["ABS_TOL"]
+
+    result = []
+    for v1, v2 in zip(v1s, v2s):
+        dx, dy, dz = v1.x - v2.x, v1.y - v2.y, v1.z - v2.z
+        result.append(dx * dx + dy * dy + dz * dz <= tolerance)
 
-    return math.isclose(difference.length_sq(), 0.0, abs_tol=tolerance)
+    return result
 
 
 def angle_between(v1: Vector3, v2: Vector3) -> float:
-    """Return the angle between two vectors in radians."""
-    dot = v1 * v2
-    lengths = v1.length() * v2.length()
+    """Return the angle between two vectors in radians.
+
+    Raise a ZeroDivisionError if either vector has zero length (the angle is undefined).
+    """
+    # The arctangent of the sine and cosine terms stays accurate for (nearly) parallel vectors where
+    # the arccosine loses precision (or is passed a cosine just outside [-1, 1] by rounding). The
+    # cross and dot products are written out so no intermediate vector is created.
+    x1, y1, z1 = v1.x, v1.y, v1.z
+    x2, y2, z2 = v2.x, v2.y, v2.z
+
+    sine = math.hypot(y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2)
+    cosine = x1 * x2 + y1 * y2 + z1 * z2
+
+    # Both terms only vanish together when a vector has zero length.
+    if sine == 0 and cosine == 0:
+        raise ZeroDivisionError("The angle with a zero length vector is undefined")
 
-    return math.acos(dot / lengths)
+    return math.atan2(sine, cosine)
+
+
+def angle_between_many(v1s: Iterable[Vector3], v2s: Iterable[Vector3]) -> List[float]:
+    """Return the angle between each pair of vectors in radians.
+
+    See `angle_between`.
+    """
+    atan2, hypot = math.atan2, math.hypot
+
+    result = []
+    for v1, v2 in zip(v1s, v2s):
+        sine = hypot(
+            v1.y * v2.z - v1.z * v2.y, v1.z * v2.x - v1.x * v2.z, v1.x * v2.y - v1.y * v2.x
+        )
+        cosine = v1.x * v2.x + v1.y * v2.y + v1.z * v2.z
+
+        if sine == 0 and cosine == 0:
+            raise ZeroDivisionError("The angle with a zero length vector is undefined")
+
+        result.append(atan2(sine, cosine))
+
+    return result
 
 
 def cross(v1: Vector3, v2: Vector3) -> Vector3:
@@ -186,30 +269,35 @@ def cross(v1: Vector3, v2: Vector3) -> Vector3:
     return Vector3(v1.y * v2.z - v1.z * v2.y, v1.z * v2.x - v1.x * v2.z, v1.x * v2.y - v1.y * v2.x)
 
 
+def cross_many(v1s: Iterable[Vector3], v2s: Iterable[Vector3]) -> List[Vector3]:
+    """Return the cross product of each pair of vectors.
+
+    See `cross`.
+    """
+    return [
+        Vector3(v1.y * v2.z - v1.z * v2.y, v1.z * v2.x - v1.x * v2.z, v1.x * v2.y - v1.y * v2.x)
+        for v1, v2 in zip(v1s, v2s)
+    ]
+
+
 def is_orthonormal_basis(
     x: Vector3, y: Vector3, z: Vector3, tolerance: Optional[float] = None
 ) -> bool:
     """Return True if the three vectors are of unit length and mutually perpendicular."""
     tolerance = tolerance or parameters["ABS_TOL"]
 
-    are_perpendicular = all(
-        [
-            x.is_perpendicular_to(y, tolerance=tolerance),
-            y.is_perpendicular_to(z, tolerance=tolerance),
-            z.is_perpendicular_to(x, tolerance=tolerance),
-        ]
+    # The dot products and lengths are written out (and the checks short circuit) rather than
+    # calling a method for each of the six checks. A dot product is within the tolerance of zero
+    # exactly when `Vector3.is_perpendicular_to` would be True.
+    return (
+        abs(x.x * y.x + x.y * y.y + x.z * y.z) <= tolerance
+        and abs(y.x * z.x + y.y * z.y + y.z * z.z) <= tolerance
+        and abs(z.x * x.x + z.y * x.y + z.z * x.z) <= tolerance
+        and math.isclose(math.hypot(x.x, x.y, x.z), 1, abs_tol=tolerance)
+        and math.isclose(math.hypot(y.x, y.y, y.z), 1, abs_tol=tolerance)
+        and math.isclose(math.hypot(z.x, z.y, z.z), 1, abs_tol=tolerance)
     )
 
-    are_unit_length = all(
-        [
-            math.isclose(x.length(), 1, abs_tol=tolerance),
-            math.isclose(y.length(), 1, abs_tol=tolerance),
-            math.isclose(z.length(), 1, abs_tol=tolerance),
-        ]
-    )
-
-    return are_perpendicular and are_unit_length
-
 
 def normalize(v: Vector3) -> Vector3:
     """Return the vector normalized to unit length.
@@ -218,3 +306,17 @@ def normalize(v: Vector3) -> Vector3:
     """
     length = v.length()
     return Vector3(v.x / length, v.y / length, v.z / length)
+
+
+def normalize_many(vs: Iterable[Vector3]) -> List[Vector3]:
+    """Return each of the vectors normalized to unit length.
+
+    See `normalize`.
+    """
+    result = []
+    for v in vs:
+        x, y, z = v.x, v.y, v.z
+        length = math.hypot(x, y, z)
+        result.append(Vector3(x / length, y / length, z / length))
+
+    return result
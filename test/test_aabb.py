@@ -1,7 +1,9 @@
 import math
 import unittest
+from types import SimpleNamespace
 
 from spatial3d import AABB, CoordinateAxes, Ray, Vector3
+from spatial3d.aabb import intersect_many, intersect_ray_aabb, inverse_direction
 from spatial3d.transform import Transform
 
 
@@ -50,6 +52,16 @@ class TestAABB(unittest.TestCase):
             with self.subTest(case=corner):
                 self.assertTrue(corner in actual)
 
+    def test_is_empty_returns_true_until_the_bounding_box_is_expanded(self) -> None:
+        aabb = AABB()
+        self.assertTrue(aabb.is_empty)
+
+        aabb.expand(AABB())
+        self.assertTrue(aabb.is_empty)
+
+        aabb.expand(self.v1)
+        self.assertFalse(aabb.is_empty)
+
     def test_size_returns_the_component_wise_size_of_the_bounding_box(self) -> None:
         expected = self.v1 - self.v2
 
@@ -76,6 +88,21 @@ class TestAABB(unittest.TestCase):
         self.assertAlmostEqual(self.v2, self.aabb.min)
         self.assertAlmostEqual(self.v4, self.aabb.max)
 
+    def test_expand_expands_to_fit_mixed_lists_of_points_and_bounding_boxes(self) -> None:
+        aabb = AABB()
+        aabb.expand([self.v1, AABB([self.v3, self.v4]), (self.v2,)])
+
+        self.assertAlmostEqual(self.v2, aabb.min)
+        self.assertAlmostEqual(self.v4, aabb.max)
+
+    def test__init__bounds_a_flat_list_of_points_like_expand(self) -> None:
+        expanded = AABB()
+        expanded.expand([self.v1, self.v2, self.v3])
+
+        self.assertEqual(self.aabb.min, expanded.min)
+        self.assertEqual(self.aabb.max, expanded.max)
+        self.assertFalse(self.aabb.is_empty)
+
     def test_expand_raises_for_incompatible_type(self) -> None:
         with self.assertRaises(TypeError):
             self.aabb.expand("String")
@@ -110,6 +137,16 @@ class TestAABB(unittest.TestCase):
             with self.subTest(msg=f"Test #{index}, Ray {ray}"):
                 self.assertEqual(self.aabb.intersect(ray), expected)
 
+    def test_intersect_accepts_a_ray_like_object_without_a_reciprocal_direction(self) -> None:
+        origin = Vector3(2, 3, 1)
+
+        for direction in [Vector3(1, 0, 0), Vector3(-1, -1, 1)]:
+            ray = Ray(origin, direction)
+            ray_like = SimpleNamespace(origin=ray.origin, direction=ray.direction)
+            with self.subTest(msg=f"Ray {ray}"):
+                self.assertEqual(self.aabb.intersect(ray_like), self.aabb.intersect(ray))
+                self.assertEqual(intersect_many([self.aabb], ray_like), [self.aabb.intersect(ray)])
+
     def test_sphere_radius_returns_the_radius_of_a_bounding_sphere(self) -> None:
         expected = self.aabb.min.length()
         self.assertAlmostEqual(self.aabb.sphere_radius(), expected)
@@ -153,3 +190,24 @@ class TestAABB(unittest.TestCase):
 
         self.assertAlmostEqual(transformed.min, Vector3(-math.sqrt(2), -math.sqrt(2), -1))
         self.assertAlmostEqual(transformed.max, Vector3(math.sqrt(2), math.sqrt(2), 1))
+
+    def test_aabb_intersect_many_returns_the_intersection_with_each_bounding_box(self) -> None:
+        boxes = [self.aabb, AABB([self.v3, self.v4]), AABB([self.v4, 2 * self.v4])]
+        ray = Ray(Vector3(), Vector3(1, 1, 1))
+
+        self.assertEqual(intersect_many(boxes, ray), [box.intersect(ray) for box in boxes])
+        self.assertEqual(intersect_many(boxes, ray, max_t=4), [True, True, False])
+
+    def test_aabb_intersect_ray_aabb_matches_intersect(self) -> None:
+        origin = Vector3(2, 3, 1)
+
+        for direction in [Vector3(1, 0, 0), Vector3(-1, 0, 1), Vector3(-1, -1, 1)]:
+            ray = Ray(origin, direction)
+            with self.subTest(msg=f"Ray {ray}"):
+                actual = intersect_ray_aabb(
+                    self.aabb.min, self.aabb.max, ray.origin, inverse_direction(ray.direction)
+                )
+                self.assertEqual(actual, self.aabb.intersect(ray))
+
+    def test_aabb_inverse_direction_returns_infinity_for_zero_components(self) -> None:
+        self.assertEqual(inverse_direction(Vector3(2, 0, -4)), Vector3(0.5, math.inf, -0.25))
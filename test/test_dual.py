@@ -40,6 +40,9 @@ class TestDual(unittest.TestCase):
         expected = Dual(self.r2 * self.r1, self.r2 * self.d1 + self.d2 * self.r1)
         self.assertEqual(self.dq2 * self.dq1, expected)
 
+    def test__mul__returns_the_dual_product_of_dual_numbers(self) -> None:
+        self.assertEqual(Dual(1, 2) * Dual(3, 4), Dual(3, 10))
+
     def test__mul__returns_the_left_and_right_scalar_product(self) -> None:
         expected = Dual(self.s * self.r1, self.s * self.d1)
         self.assertEqual(self.s * self.dq1, expected)
@@ -90,3 +93,9 @@ class TestDual(unittest.TestCase):
     def test_dual_conjugate_raises_for_incompatible_types(self) -> None:
         with self.assertRaises(NotImplementedError):
             dual.conjugate(Dual(Vector3(), Vector3()))
+
+    def test_dual_translation_returns_the_translation_of_a_dual_quaternion(self) -> None:
+        # The dual part of a pure translation t is 0.5 * t as a pure quaternion.
+        translation = Dual(Quaternion(1, 0, 0, 0), Quaternion(0, 2, -1, 3))
+
+        self.assertEqual(dual.translation(translation), (4, -2, 6))
@@ -24,6 +24,10 @@ class TestEdge(unittest.TestCase):
         other_edge = Edge(self.start, self.middle)
         self.assertNotEqual(other_edge, self.edge)
 
+    def test__hash__is_equal_for_edges_regardless_of_direction(self) -> None:
+        edges = {self.edge, Edge(self.end, self.start), Edge(self.start, self.middle)}
+        self.assertEqual(len(edges), 2)
+
     def test__eq__returns_notimplemented_for_incompatible_types(self) -> None:
         self.assertTrue(self.edge.__eq__(2) == NotImplemented)
         self.assertTrue(self.edge.__eq__("string") == NotImplemented)
@@ -4,14 +4,12 @@ from operator import itemgetter
 from typing import List
 
 from spatial3d import Quaternion, Vector3
-from spatial3d.euler import Axes, Order, angles
+from spatial3d.euler import Axes, Order, angles, angles_many
 
 
 def fix_angle_range(angle: float) -> float:
     """Return the provided angle in the range [-math.pi, math.pi]."""
-
-    tau = 2 * math.pi
-    return ((angle + math.pi) % tau) - math.pi
+    return math.remainder(angle, math.tau)
 
 
 def build_solutions(angles: List[float], is_tait_bryan: bool):
@@ -92,6 +90,55 @@ class TestEuler(unittest.TestCase):
                 for actual, expected in zip(results[0], values):
                     self.assertAlmostEqual(actual, expected)
 
+    def test_convert_many_returns_the_euler_angles_of_each_quaternion(self) -> None:
+        quaternions = [Quaternion.from_axis_angle(Vector3(1, 2, 3), angle) for angle in [0.5, 1]]
+
+        for euler_axes in Axes:
+            with self.subTest(f"Axes: {euler_axes}"):
+                expected = [euler_axes.convert(q) for q in quaternions]
+                self.assertEqual(euler_axes.convert_many(quaternions), expected)
+
+    def test_angles_many_returns_the_euler_angles_of_each_quaternion(self) -> None:
+        quaternions = [Quaternion.from_axis_angle(Vector3(1, 2, 3), angle) for angle in [0.5, 1]]
+
+        for euler_axes in Axes:
+            for order in Order:
+                with self.subTest(f"Axes: {euler_axes}, Order: {order}"):
+                    expected = [angles(q, euler_axes, order) for q in quaternions]
+                    self.assertEqual(angles_many(quaternions, euler_axes, order), expected)
+
+        with self.assertRaises(TypeError):
+            _ = angles_many(quaternions, "ZYZ", Order.INTRINSIC)
+
+    def test_basis_vector_returns_a_new_vector_each_call(self) -> None:
+        for axis, expected in zip("xyz", [Vector3.X(), Vector3.Y(), Vector3.Z()]):
+            with self.subTest(f"Axis: {axis}"):
+                vector = Axes.basis_vector(axis)
+                self.assertEqual(vector, expected)
+
+                vector.y = 7
+                self.assertEqual(Axes.basis_vector(axis), expected)
+                self.assertIsNot(Axes.basis_vector(axis), Axes.basis_vector(axis))
+
+    def test_vectors_returns_a_new_list_of_new_vectors_each_call(self) -> None:
+        basis = {"X": Vector3.X(), "Y": Vector3.Y(), "Z": Vector3.Z()}
+
+        for euler_axes in Axes:
+            with self.subTest(f"Axes: {euler_axes}"):
+                vectors = euler_axes.vectors
+                self.assertEqual(vectors, [basis[letter] for letter in euler_axes.name])
+
+                vectors[0].y = 7
+                vectors.append(Vector3())
+                self.assertEqual(euler_axes.vectors, [basis[letter] for letter in euler_axes.name])
+
+    def test_is_tait_bryan_returns_true_for_axes_using_all_three_letters(self) -> None:
+        tait_bryan = [Axes.XYZ, Axes.YZX, Axes.ZXY, Axes.XZY, Axes.ZYX, Axes.YXZ]
+
+        for euler_axes in Axes:
+            with self.subTest(f"Axes: {euler_axes}"):
+                self.assertEqual(euler_axes.is_tait_bryan, euler_axes in tait_bryan)
+
     def test_angles_raises_for_unknown_types(self) -> None:
         with self.assertRaises(TypeError):
             _ = angles(Quaternion(), "ZYZ", Order.INTRINSIC)
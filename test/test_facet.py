@@ -4,6 +4,7 @@ from typing import Optional
 
 from spatial3d import AABB, Edge, Facet, Intersection, Ray, Vector3
 from spatial3d.exceptions import DegenerateTriangleError
+from spatial3d.facet import closest_intersection
 from spatial3d.transform import Transform
 
 
@@ -31,10 +32,33 @@ class TestFacet(unittest.TestCase):
         with self.assertRaises(DegenerateTriangleError):
             bad_facet.computed_normal
 
+    def test__init__accepts_fewer_than_three_vertices_with_a_normal(self) -> None:
+        facet = Facet(self.vertices[:2], Vector3.Z())
+        self.assertFalse(facet.is_triangle)
+
+        with self.assertRaises(DegenerateTriangleError):
+            Facet(self.vertices[:2])
+
+    def test__init__accepts_an_iterable_of_vertices_with_a_normal(self) -> None:
+        facet = Facet(iter(self.vertices), Vector3.Z())
+        self.assertEqual(facet.normal, Vector3.Z())
+
+    def test_intersect_uses_the_vertices_at_first_use(self) -> None:
+        facet = Facet([Vector3.X(), Vector3()], Vector3.Z())
+        facet.vertices[1] = Vector3.Y()
+        facet.vertices.append(-Vector3.X())
+
+        ray = Ray(Vector3(0.25, 0.25, 1), -Vector3.Z())
+        self.assertEqual(facet.intersect(ray).t, self.facet.intersect(ray).t)
+
     def test_edges_return_all_edges_in_the_facet(self) -> None:
         self.assertEqual(len(self.facet.edges), 3)
         self.assertTrue(all(isinstance(edge, Edge) for edge in self.facet.edges))
 
+    def test_edges_join_consecutive_vertices_and_wrap_around(self) -> None:
+        v1, v2, v3 = self.vertices
+        self.assertEqual(self.facet.edges, [Edge(v1, v2), Edge(v2, v3), Edge(v3, v1)])
+
     def test_is_triangle_returns_true_for_three_vertices(self) -> None:
         self.assertTrue(self.facet.is_triangle)
         self.facet.vertices.append(Vector3())
@@ -59,18 +83,50 @@ class TestFacet(unittest.TestCase):
             (Ray(self.origins[2], Vector3(-1, -1, -1)), Vector3()),
         ]
 
-        for ray, intersection in test_cases:
+        # The batched intersection must agree with intersecting each ray on its own.
+        batched = self.facet.intersect_many([ray for ray, _ in test_cases])
+
+        for (ray, intersection), batched_result in zip(test_cases, batched):
             with self.subTest(f"Check {ray}"):
                 result = self.facet.intersect(ray)
+                self.assertEqual(batched_result, result)
 
                 expected = Intersection(compute_t(ray, intersection), None)
 
                 if expected.hit:
                     self.assertAlmostEqual(result.t, expected.t)
                 else:
-                    self.assertIsNone(result.t)
+                    self.assertEqual(result.t, math.inf)
                     self.assertIsNone(result.obj)
 
+    def test_intersect_many_returns_the_intersection_of_each_ray(self) -> None:
+        rays = [
+            Ray(self.origins[1], -Vector3.Z()),
+            Ray(self.origins[1], Vector3.Z()),
+            Ray(self.origins[2], Vector3(-1, -1, -1)),
+        ]
+
+        results = self.facet.intersect_many(rays)
+
+        self.assertEqual(results, [self.facet.intersect(ray) for ray in rays])
+        self.assertEqual([result.hit for result in results], [True, False, True])
+
+    def test_facet_closest_intersection_returns_the_closest_facet_intersection(self) -> None:
+        facets = [
+            Facet([Vector3(), Vector3.X(), Vector3.Y()]),
+            Facet([Vector3(0, 0, 1), Vector3(1, 0, 1), Vector3(0, 1, 1)]),
+            Facet([Vector3(0, 0, 1), Vector3(0, 1, 1), Vector3(1, 0, 1)]),
+        ]
+
+        for direction in [Vector3(0.1, 0.2, -1), Vector3(0.1, 0.2, 1), Vector3.X()]:
+            ray = Ray(Vector3(0, 0, 2), direction)
+            with self.subTest(msg=f"Ray {ray}"):
+                expected = ray.closest_intersection(facets)
+                self.assertEqual(closest_intersection(facets, ray), expected)
+
+        ray = Ray(Vector3(0.1, 0.1, 2), -Vector3.Z())
+        self.assertEqual(closest_intersection(facets, ray, check_back_facing=True).obj, facets[1])
+
     def test_scale_returns_a_scaled_facet(self) -> None:
         scaled_facet = self.facet.scale(2)
         for actual, vertex in zip(scaled_facet.vertices, self.vertices):
@@ -1,3 +1,4 @@
+import math
 import unittest
 
 from spatial3d import Intersection
@@ -16,14 +17,18 @@ class TestIntersection(unittest.TestCase):
     def test__new__parameters_t_and_obj_are_optional(self) -> None:
         x = Intersection(None, None)
 
-        self.assertIsNone(x.t)
+        self.assertEqual(x.t, math.inf)
         self.assertIsNone(x.obj)
+        self.assertFalse(x.hit)
 
     def test_miss_creates_an_intersection_which_is_not_a_hit(self) -> None:
         self.assertFalse(self.miss.hit)
-        self.assertIsNone(self.miss.t)
+        self.assertEqual(self.miss.t, math.inf)
         self.assertIsNone(self.miss.obj)
 
+    def test_miss_returns_a_shared_intersection(self) -> None:
+        self.assertIs(Intersection.Miss(), Intersection.Miss())
+
     def test_hit_returns_true_for_positive_t(self) -> None:
         cases = [Intersection(0, None), Intersection(1.0, None), Intersection(1.0, "Something")]
 
@@ -29,6 +29,9 @@ class TestKDTree(unittest.TestCase):
     def test__init__creates_a_node_with_no_children(self) -> None:
         self.assertEqual(len(self.root_node.children), 0)
 
+    def test__init__creates_a_node_without_a_dict(self) -> None:
+        self.assertFalse(hasattr(self.root_node, "__dict__"))
+
     def test_is_leaf_returns_true_if_there_are_no_children(self) -> None:
         self.assertTrue(self.empty_node.is_leaf)
 
@@ -40,6 +43,12 @@ class TestKDTree(unittest.TestCase):
         self.assertEqual(len(self.root_node.children), 2)
         self.assertEqual(len(self.root_node.facets), 0)
 
+    def test_branch_records_the_splitting_plane(self) -> None:
+        plane = self.root_node.splitting_plane(0)
+        self.root_node.branch()
+
+        self.assertEqual((self.root_node.split_axis, self.root_node.split_value), plane)
+
     def test_branch_does_not_split_if_there_are_no_facets(self) -> None:
         self.empty_node.branch()
         self.assertEqual(len(self.empty_node.children), 0)
@@ -62,6 +71,28 @@ class TestKDTree(unittest.TestCase):
         hit = self.root_node.intersect(Ray(Vector3(-0.5, 0.5, 3), -Vector3.Z()))
         self.assertTrue(hit.hit)
 
+    def test_intersect_returns_the_closest_intersection_from_either_side_of_the_split(self) -> None:
+        self.root_node.branch()
+
+        for sign in [1, -1]:
+            ray = Ray(Vector3(sign * 3, 0.25, 0.5), Vector3(-sign, 0, 0))
+            with self.subTest(f"Ray {ray}"):
+                expected = ray.closest_intersection(self.facets)
+                self.assertEqual(self.root_node.intersect(ray), expected)
+
+    def test_intersect_many_returns_the_intersection_of_each_ray(self) -> None:
+        self.root_node.branch()
+
+        rays = [
+            Ray(Vector3(-0.5, 0.5, 3), Vector3.Z()),
+            Ray(Vector3(-0.5, 0.5, 3), -Vector3.Z()),
+            Ray(Vector3(3, 0.25, 0.5), -Vector3.X()),
+            Ray(Vector3(-3, 0.25, 0.5), Vector3.X()),
+        ]
+
+        expected = [self.root_node.intersect(ray) for ray in rays]
+        self.assertEqual(self.root_node.intersect_many(rays), expected)
+
     def test_split_facets_partitions_facets_into_left_and_right(self) -> None:
         left, right = self.root_node.split_facets(CoordinateAxes.X, 0)
 
@@ -77,8 +108,37 @@ class TestKDTree(unittest.TestCase):
         for index in right_expected:
             self.assertTrue(self.facets[index] in right)
 
+    def test_split_facets_keeps_facets_lying_in_the_plane_on_the_left(self) -> None:
+        planar = Facet([Vector3(0, -1, -1), Vector3(0, 1, -1), Vector3(0, 1, 1)])
+        node = KDTreeNode(self.aabb, [planar])
+
+        left, right = node.split_facets(CoordinateAxes.X, 0)
+
+        self.assertEqual(left, [planar])
+        self.assertEqual(right, [])
+
     def test_splitting_plane_returns_the_splitting_plane_at_a_given_depth(self) -> None:
         for depth in range(3):
             plane_axis, plane_value = self.root_node.splitting_plane(depth)
             self.assertEqual(plane_axis, CoordinateAxes(depth))
             self.assertEqual(plane_value, self.aabb.center[depth])
+
+    def test_splitting_plane_minimizes_the_surface_area_heuristic(self) -> None:
+        def slab(x_min: float, x_max: float) -> Facet:
+            """Return a facet spanning the node in Y and Z between the provided X values."""
+            return Facet([Vector3(x_min, -1, -1), Vector3(x_max, 1, -1), Vector3(x_min, 1, 1)])
+
+        node = KDTreeNode(self.aabb, [slab(-1, -0.5), slab(-1, -0.5), slab(0.5, 1)])
+
+        self.assertEqual(node.splitting_plane(0), (CoordinateAxes.X, -0.5))
+
+    def test_splitting_plane_counts_facets_lying_in_the_plane_on_the_left(self) -> None:
+        # A small facet in the plane X = 0.5 and a facet spanning -0.5 <= X <= 1. Splitting at
+        # X = 0.5 keeps both facets on the left so X = -0.5 is the cheaper split.
+        planar = Facet([Vector3(0.5, -1, -1), Vector3(0.5, 0, -1), Vector3(0.5, -1, 0)])
+        spanning = Facet([Vector3(-0.5, -1, -1), Vector3(1, 1, -1), Vector3(-0.5, -1, 1)])
+        aabb = AABB([Vector3(-1, -1, -1), Vector3(1, 1, 1)])
+
+        node = KDTreeNode(aabb, [planar, spanning])
+
+        self.assertEqual(node.splitting_plane(0), (CoordinateAxes.X, -0.5))
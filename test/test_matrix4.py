@@ -21,6 +21,16 @@ class TestMatrix4(unittest.TestCase):
         for index, value in enumerate(m):
             self.assertEqual(value, index)
 
+    def test__init__gives_each_identity_matrix_its_own_list_of_elements(self) -> None:
+        m = Matrix4()
+        self.assertIsInstance(m.elements, list)
+
+        m.elements[3] = 5
+        self.assertEqual(Matrix4().elements[3], 0)
+
+    def test__init__creates_a_matrix_without_a_dict(self) -> None:
+        self.assertFalse(hasattr(Matrix4(), "__dict__"))
+
     def test__init__raises_if_not_given_16_elements(self) -> None:
         with self.assertRaises(TypeError):
             Matrix4([0] * 15)
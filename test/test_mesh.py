@@ -2,7 +2,7 @@ import math
 import unittest
 from unittest import mock
 
-from spatial3d import AABB, Facet, KDTreeNode, Mesh, Transform, Vector3
+from spatial3d import AABB, Facet, KDTreeNode, Mesh, Ray, Transform, Vector3
 
 
 class TestMesh(unittest.TestCase):
@@ -61,6 +61,13 @@ class TestMesh(unittest.TestCase):
         self.mesh.append(Facet([2 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]))
         self.assertEqual(len(self.mesh.facets), num_facets + 1)
 
+    def test_append_updates_the_aabb_without_an_accelerator(self) -> None:
+        self.mesh.append(Facet([2 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]))
+        self.mesh.append(Facet([-3 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]))
+
+        self.assertEqual(self.mesh.aabb.min, Vector3(-3, -1, -1))
+        self.assertEqual(self.mesh.aabb.max, Vector3(2, 2, 2))
+
     def test_append_updates_the_aabb_and_accelerator(self) -> None:
         self.mesh.accelerator = KDTreeNode
         original_accelerator = self.mesh.accelerator
@@ -70,11 +77,48 @@ class TestMesh(unittest.TestCase):
         self.assertEqual(self.mesh.aabb.max, Vector3(2, 2, 2))
         self.assertIsNot(self.mesh.accelerator, original_accelerator)
 
+    def test_append_rebuilds_the_accelerator_once_when_it_is_next_used(self) -> None:
+        self.mesh.accelerator = KDTreeNode
+
+        with mock.patch.object(KDTreeNode, "branch") as branch:
+            self.mesh.append(Facet([2 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]))
+            self.mesh.append(Facet([-3 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]))
+            branch.assert_not_called()
+
+            accelerator = self.mesh.accelerator
+            branch.assert_called_once()
+
+        self.assertIs(self.mesh.accelerator, accelerator)
+        self.assertEqual(len(accelerator.facets), len(self.mesh.facets))
+
+    def test_extend_adds_the_facets_and_updates_the_aabb_and_accelerator(self) -> None:
+        self.mesh.accelerator = KDTreeNode
+        original_accelerator = self.mesh.accelerator
+        num_facets = len(self.mesh.facets)
+
+        self.mesh.extend(
+            [
+                Facet([2 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]),
+                Facet([-3 * Vector3.X(), 2 * Vector3.Y(), 2 * Vector3.Z()]),
+            ]
+        )
+
+        self.assertEqual(len(self.mesh.facets), num_facets + 2)
+        self.assertEqual(self.mesh.aabb.min, Vector3(-3, -1, -1))
+        self.assertEqual(self.mesh.aabb.max, Vector3(2, 2, 2))
+        self.assertIsNot(self.mesh.accelerator, original_accelerator)
+
     def test_intersect_brute_forces_an_intersection_against_all_facets(self) -> None:
-        ray = mock.Mock()
-        self.mesh.intersect(ray)
+        rays = [
+            Ray(Vector3(0.5, 0.5, 3), -Vector3.Z()),
+            Ray(Vector3(3, 0.5, 0.5), -Vector3.X()),
+            Ray(Vector3(5, 0.5, 0.5), Vector3.Y()),
+        ]
 
-        ray.closest_intersection.assert_called_once_with(self.mesh.facets)
+        for ray in rays:
+            with self.subTest(msg=f"Ray {ray}"):
+                expected = ray.closest_intersection(self.mesh.facets)
+                self.assertEqual(self.mesh.intersect(ray), expected)
 
     def test_intersect_calls_the_accelerator_intersection_if_one_exists(self) -> None:
         self.mesh.accelerator = self.accelerator
@@ -82,9 +126,21 @@ class TestMesh(unittest.TestCase):
         ray = mock.Mock()
         self.mesh.intersect(ray)
 
-        ray.closest_intersection.assert_not_called()
         self.mesh.accelerator.intersect.assert_called_once_with(ray)
 
+    def test_intersect_many_returns_the_intersection_of_each_ray(self) -> None:
+        rays = [
+            Ray(Vector3(0.5, 0.5, 3), -Vector3.Z()),
+            Ray(Vector3(3, 0.5, 0.5), -Vector3.X()),
+            Ray(Vector3(5, 0.5, 0.5), Vector3.Y()),
+        ]
+
+        expected = [self.mesh.intersect(ray) for ray in rays]
+        self.assertEqual(self.mesh.intersect_many(rays), expected)
+
+        self.mesh.accelerator = KDTreeNode
+        self.assertEqual(self.mesh.intersect_many(rays), expected)
+
     def test_scale_returns_a_scaled_mesh(self) -> None:
         scale = 3
         scaled = self.mesh.scale(scale)
@@ -93,6 +149,32 @@ class TestMesh(unittest.TestCase):
         self.assertEqual(scaled.aabb.max, scale * self.mesh.aabb.max)
         self.assertEqual(scaled.facets[0].vertices[1], scale * self.mesh.facets[0].vertices[1])
 
+    def test_scale_bounds_the_scaled_vertices_for_a_negative_factor(self) -> None:
+        mesh = Mesh("Shifted", [Facet([Vector3(1, 2, 3), Vector3(2, 2, 3), Vector3(1, 4, 5)])])
+        scaled = mesh.scale(-2)
+
+        self.assertEqual(scaled.aabb.min, Vector3(-4, -8, -10))
+        self.assertEqual(scaled.aabb.max, Vector3(-2, -4, -6))
+
+    def test_scale_matches_scaling_each_facet(self) -> None:
+        scaled = self.mesh.scale(-2)
+
+        for facet, scaled_facet in zip(self.mesh.facets, scaled.facets):
+            expected = facet.scale(-2)
+            self.assertEqual(scaled_facet.vertices, expected.vertices)
+            self.assertEqual(scaled_facet.normal, expected.normal)
+
+    def test_scale_keeps_the_vertices_of_each_facet_together(self) -> None:
+        quad = Facet([Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(1, 1, 0), Vector3(0, 1, 0)])
+        triangle = Facet([Vector3(0, 0, 1), Vector3(1, 0, 1), Vector3(0, 1, 1)])
+        mesh = Mesh("Mixed", [quad, triangle])
+
+        scaled = mesh.scale(3)
+
+        for facet, scaled_facet in zip(mesh.facets, scaled.facets):
+            with self.subTest(vertices=len(facet.vertices)):
+                self.assertEqual(scaled_facet.vertices, facet.scale(3).vertices)
+
     def test_transform_returns_a_transformed_mesh(self) -> None:
         t = Transform.from_axis_angle_translation(translation=Vector3(1, 2, 3))
 
@@ -104,7 +186,27 @@ class TestMesh(unittest.TestCase):
             transformed.facets[0].vertices[1], t.transform(self.mesh.facets[0].vertices[1])
         )
 
+    def test_transform_keeps_the_vertices_of_each_facet_together(self) -> None:
+        quad = Facet([Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(1, 1, 0), Vector3(0, 1, 0)])
+        triangle = Facet([Vector3(0, 0, 1), Vector3(1, 0, 1), Vector3(0, 1, 1)])
+        mesh = Mesh("Mixed", [quad, triangle])
+        t = Transform.from_axis_angle_translation(translation=Vector3(1, 2, 3))
+
+        transformed = mesh.transform(t)
+
+        for facet, transformed_facet in zip(mesh.facets, transformed.facets):
+            with self.subTest(vertices=len(facet.vertices)):
+                self.assertEqual(transformed_facet.vertices, facet.transform(t).vertices)
+
     def test_vertices_returns_the_list_of_vertices_in_the_mesh(self) -> None:
         self.assertEqual(len(list(self.mesh.vertices)), 3 * len(self.mesh.facets))
         for vertex in self.vertices:
             self.assertIsInstance(vertex, Vector3)
+
+    def test_vertices_returns_every_vertex_of_each_facet(self) -> None:
+        quad = Facet([Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(1, 1, 0), Vector3(0, 1, 0)])
+        triangle = Facet([Vector3(0, 0, 1), Vector3(1, 0, 1), Vector3(0, 1, 1)])
+
+        mesh = Mesh("Mixed", [quad, triangle])
+
+        self.assertEqual(list(mesh.vertices), quad.vertices + triangle.vertices)
@@ -44,6 +44,18 @@ class TestQuaternion(unittest.TestCase):
         expected = Quaternion(c, s * self.axis.x, s * self.axis.y, s * self.axis.z)
         self.assertEqual(Quaternion.from_axis_angle(self.axis, angle), expected)
 
+    def test_from_axis_angle_constructs_new_quaternions_about_basis_axes(self) -> None:
+        angle = math.radians(-30)
+        c = math.cos(angle / 2)
+        s = math.sin(angle / 2)
+
+        first = Quaternion.from_axis_angle(-Vector3.Y(), angle)
+        self.assertEqual(first, Quaternion(c, 0, -s, 0))
+
+        # The memoized rotation must not be shared between calls.
+        first.conjugate()
+        self.assertEqual(Quaternion.from_axis_angle(-Vector3.Y(), angle), Quaternion(c, 0, -s, 0))
+
     def test_from_euler_constructs_a_quaternion_from_euler_angles(self) -> None:
         angle = math.radians(45)
         y = Quaternion.from_axis_angle(Vector3(0, 1, 0), angle)
@@ -118,6 +130,16 @@ class TestQuaternion(unittest.TestCase):
 
         self.assertEqual(self.q, self.r)
 
+    def test__setitem__sets_the_component_at_the_provided_index_of_a_subclass(self) -> None:
+        class Labelled(Quaternion):
+            __slots__ = ["label"]
+
+        q = Labelled(*self.q)
+        for index, name in enumerate("rxyz"):
+            with self.subTest(index=index):
+                q[index] = 10 + index
+                self.assertEqual(getattr(q, name), 10 + index)
+
     def test__str__contains_the_components_of_the_vector(self) -> None:
         self.assertTrue(str(self.q.r) in str(self.q))
         self.assertTrue(str(self.q.x) in str(self.q))
@@ -181,6 +203,14 @@ class TestQuaternion(unittest.TestCase):
 
         self.assertEqual(result, expected)
 
+    def test_quaternion_rotation_matrix_rotates_like_the_quaternion(self) -> None:
+        matrix = quaternion.rotation_matrix(self.q)
+
+        for vector in [Vector3.X(), Vector3.Y(), Vector3.Z(), self.axis]:
+            with self.subTest(case=vector):
+                result = Vector3(*(Vector3(*row) * vector for row in matrix))
+                self.assertAlmostEqual(result, self.q.rotate(vector))
+
     def test_quaternion_slerp_returns_the_endpoints_for_0_and_1(self) -> None:
         self.q.normalize()
         self.r.normalize()
@@ -188,6 +218,15 @@ class TestQuaternion(unittest.TestCase):
         self.assertAlmostEqual(quaternion.slerp(self.q, self.r, 0), self.q)
         self.assertAlmostEqual(quaternion.slerp(self.q, self.r, 1), self.r)
 
+    def test_quaternion_slerp_interpolates_nearly_parallel_quaternions(self) -> None:
+        start = Quaternion.from_axis_angle(self.axis, 0)
+        end = Quaternion.from_axis_angle(self.axis, math.radians(1))
+
+        result = quaternion.slerp(start, end, 0.5)
+
+        self.assertAlmostEqual(result, Quaternion.from_axis_angle(self.axis, math.radians(0.5)))
+        self.assertAlmostEqual(result.norm(), 1)
+
     def test_quaternion_slerp_returns_the_endpoints_for_identical_quaternions(self) -> None:
         self.q.normalize()
 
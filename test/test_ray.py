@@ -16,6 +16,11 @@ class TestRay(unittest.TestCase):
         with self.assertRaises(ValueError):
             Ray(Vector3(), Vector3())
 
+    def test_direction_setter_updates_the_inverse_direction(self) -> None:
+        self.ray.direction = Vector3(0, 2, -4)
+
+        self.assertEqual(self.ray.inv_direction, Vector3(math.inf, 0.5, -0.25))
+
     def test__str__contains_the_components_of_the_ray(self) -> None:
         self.assertTrue(str(self.ray.origin) in str(self.ray))
 
@@ -32,7 +37,7 @@ class TestRay(unittest.TestCase):
         r = Ray(Vector3(0, 0, 2), Vector3.Z())
         actual = r.closest_intersection(facets)
 
-        self.assertIsNone(actual.t)
+        self.assertFalse(actual.hit)
         self.assertIsNone(actual.obj)
 
         r = Ray(Vector3(0, 0, 2), -Vector3.Z())
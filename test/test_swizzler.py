@@ -17,3 +17,30 @@ class TestSwizzler(unittest.TestCase):
     def test__getattr__raises_for_an_unknown_parameter(self) -> None:
         with self.assertRaises(AttributeError):
             values = self.v1.xyzrxyz
+
+    def test_subclass_instances_do_not_have_a_dict(self) -> None:
+        self.assertFalse(hasattr(self.v1, "__dict__"))
+
+    def test__getattr__returns_current_values_on_repeated_access(self) -> None:
+        self.assertEqual(self.v1.zyx, [-3, 2, -1])
+
+        self.v1.x = 5
+        self.assertEqual(self.v1.zyx, [-3, 2, 5])
+
+    def test__getattr__does_not_modify_the_class(self) -> None:
+        attributes = dict(vars(Vector3))
+
+        self.assertEqual(self.v1.xxyyzz, [-1, -1, 2, 2, -3, -3])
+        self.assertEqual(self.v1.xxyyzz, [-1, -1, 2, 2, -3, -3])
+
+        self.assertEqual(vars(Vector3), attributes)
+
+    def test__getattr__raises_for_a_parameter_that_has_not_been_set(self) -> None:
+        vector = Vector3.__new__(Vector3)
+
+        with self.assertRaises(AttributeError):
+            _ = vector.x
+
+    def test_subclass_defines_a_property_for_each_short_composition(self) -> None:
+        self.assertIsInstance(vars(Vector3)["yzzy"], property)
+        self.assertEqual(self.v1.yzzy, [2, -3, -3, 2])
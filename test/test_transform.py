@@ -1,7 +1,7 @@
 import math
 import unittest
 
-from spatial3d import Quaternion, Transform, Vector3
+from spatial3d import Dual, Quaternion, Transform, Vector3
 from spatial3d.euler import Axes, Order
 
 
@@ -51,6 +51,17 @@ class TestTransform(unittest.TestCase):
         self.assertAlmostEqual(results[0], Vector3(7, -2, 1))
         self.assertAlmostEqual(results[1], Vector3(11, 4, 5))
 
+    def test__call__transforms_a_list_of_objects_like_a_single_object(self) -> None:
+        for transform in [self.pureTranslate, self.pureRotate, self.both]:
+            with self.subTest(transform=transform.dual):
+                self.assertEqual(transform([self.point])[0], transform(self.point))
+
+    def test__call__applies_the_transformation_to_nested_objects(self) -> None:
+        results = self.both([self.point, [Vector3(7, -2, 1)]])
+
+        self.assertAlmostEqual(results[0], Vector3(7, -2, 1))
+        self.assertAlmostEqual(results[1][0], Vector3(11, 4, 5))
+
     def test__call__returns_notimplemented_for_incompatible_types(self) -> None:
         self.assertTrue(self.both("string") == NotImplemented)
 
@@ -93,10 +104,45 @@ class TestTransform(unittest.TestCase):
     def test_translation_returns_the_translation_component_of_the_transform(self) -> None:
         self.assertEqual(self.pureTranslate.translation, Vector3(4, 2, 6))
 
+    def test_translation_returns_a_new_vector_each_time(self) -> None:
+        translation = self.pureTranslate.translation
+        translation.x = 0
+
+        self.assertEqual(self.pureTranslate.translation, Vector3(4, 2, 6))
+
+    def test_translation_reflects_in_place_changes_to_the_dual(self) -> None:
+        transform = Transform.from_axis_angle_translation(translation=Vector3(4, 2, 6))
+        self.assertEqual(transform.translation, Vector3(4, 2, 6))
+
+        transform.dual.d.x = 1
+
+        self.assertEqual(transform.translation, Vector3(2, 2, 6))
+
+    def test_transform_reflects_in_place_changes_to_the_dual(self) -> None:
+        transform = Transform.from_axis_angle_translation(
+            Vector3.Z(), math.radians(90), translation=Vector3(1, 2, 3)
+        )
+        transform(self.point)
+        transform([self.point])
+
+        transform.dual.conjugate()
+        expected = Transform(Dual(Quaternion(*transform.dual.r), Quaternion(*transform.dual.d)))
+
+        self.assertEqual(transform.translation, expected.translation)
+        self.assertEqual(transform(self.point), expected(self.point))
+        self.assertEqual(transform([self.point]), expected([self.point]))
+
     def test_inverse_returns_the_inverse_of_the_transform(self) -> None:
         inverse = self.both.inverse()
         self.assertAlmostEqual(inverse(self.both(self.point)), self.point)
 
+    def test_inverse_returns_a_new_transform_each_call(self) -> None:
+        inverse = self.both.inverse()
+        self.assertIsNot(self.both.inverse(), inverse)
+
+        inverse.dual.conjugate()
+        self.assertAlmostEqual(self.both.inverse()(self.both(self.point)), self.point)
+
     def test_transform_applies_the_transformation_to_the_passed_object(self) -> None:
         self.assertEqual(self.pureTranslate.transform(self.point), Vector3(7, 6, 11))
         self.assertEqual(self.pureRotate.transform(self.point), Vector3(3, -4, -5))
@@ -106,3 +152,18 @@ class TestTransform(unittest.TestCase):
     def test_transform_raises_for_an_unknown_as_type(self) -> None:
         with self.assertRaises(KeyError):
             self.pureTranslate.transform(self.point, as_type="Unknown")
+
+    def test_transform_many_matches_transform_for_each_vector(self) -> None:
+        vectors = [self.point, Vector3(7, -2, 1), Vector3()]
+
+        for as_type in ["point", "vector"]:
+            results = self.both.transform_many(vectors, as_type)
+
+            self.assertEqual(len(results), len(vectors))
+            for result, vector in zip(results, vectors):
+                with self.subTest(f"{as_type}: {vector}"):
+                    self.assertEqual(result, self.both.transform(vector, as_type))
+
+    def test_transform_many_raises_for_an_unknown_as_type(self) -> None:
+        with self.assertRaises(KeyError):
+            self.pureTranslate.transform_many([self.point], as_type="Unknown")
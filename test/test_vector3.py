@@ -4,10 +4,14 @@ import unittest
 from spatial3d.vector3 import (
     Vector3,
     almost_equal,
+    almost_equal_many,
     angle_between,
+    angle_between_many,
     cross,
+    cross_many,
     is_orthonormal_basis,
     normalize,
+    normalize_many,
 )
 
 
@@ -49,6 +53,12 @@ class TestVector3(unittest.TestCase):
         for index, expected in zip(range(len(self.v1)), expecteds):
             self.assertEqual(self.v1[index], expected)
 
+    def test__getitem__supports_negative_indices_and_raises_when_out_of_range(self) -> None:
+        self.assertEqual(self.v1[-1], self.v1.z)
+
+        with self.assertRaises(IndexError):
+            self.v1[3]  # pylint: disable=pointless-statement
+
     def test__len__returns_the_number_of_dimensions(self) -> None:
         self.assertEqual(len(self.v1), 3)
 
@@ -90,11 +100,28 @@ class TestVector3(unittest.TestCase):
 
         self.assertEqual(self.v1, self.v2)
 
+    def test__setitem__supports_negative_indices_and_raises_when_out_of_range(self) -> None:
+        class Labelled(Vector3):
+            __slots__ = ["label"]
+
+        for vector in [Vector3(), Labelled()]:
+            with self.subTest(type=type(vector).__name__):
+                vector[-3], vector[-2], vector[-1] = 1, 2, 3
+                self.assertEqual((vector.x, vector.y, vector.z), (1, 2, 3))
+
+                with self.assertRaises(IndexError):
+                    vector[3] = 4
+
     def test__str__contains_the_components_of_the_vector(self) -> None:
         self.assertTrue(str(self.v1.x) in str(self.v1))
         self.assertTrue(str(self.v1.y) in str(self.v1))
         self.assertTrue(str(self.v1.z) in str(self.v1))
 
+    def test__str__matches_format_with_an_empty_specification(self) -> None:
+        for vector in [self.v1, Vector3(1.25, -0.0, 3e-9)]:
+            with self.subTest(case=vector):
+                self.assertEqual(str(vector), format(vector, ""))
+
     def test__sub__subtracts_two_vectors(self) -> None:
         self.assertEqual(self.v1 - self.v2, Vector3(-3, 7, -6))
 
@@ -136,6 +163,15 @@ class TestVector3(unittest.TestCase):
         self.assertFalse(almost_equal(self.v1, other))
         self.assertTrue(almost_equal(self.v1, other, 0.001))
 
+    def test_vector3_almost_equal_many_returns_almost_equal_for_each_pair(self) -> None:
+        v1s = [self.v1, self.v1, self.v2]
+        v2s = [self.v1, self.v1 + Vector3(0.01, 0.01, 0.01), self.v1]
+
+        for tolerance in [None, 0.001]:
+            with self.subTest(tolerance=tolerance):
+                expected = [almost_equal(v1, v2, tolerance) for v1, v2 in zip(v1s, v2s)]
+                self.assertEqual(almost_equal_many(v1s, v2s, tolerance), expected)
+
     def test_vector3_angle_between_returns_the_angle_between_two_vectors_in_radians(self) -> None:
         self.assertAlmostEqual(angle_between(self.v1, 5 * self.v1), 0)
 
@@ -149,11 +185,40 @@ class TestVector3(unittest.TestCase):
         self.assertAlmostEqual(angle_between(x, p), expected)
         self.assertAlmostEqual(angle_between(p, x), expected)
 
+    def test_vector3_angle_between_returns_zero_for_parallel_vectors(self) -> None:
+        # The cosine of these vectors rounds to just above one.
+        v = Vector3(0.1, 0.2, 0.3)
+        self.assertAlmostEqual(angle_between(v, 3.3 * v), 0)
+        self.assertEqual(angle_between(v, -v), math.pi)
+
+    def test_vector3_angle_between_many_returns_the_angle_between_each_pair(self) -> None:
+        v1s = [Vector3.X(), Vector3.Y(), self.v1]
+        v2s = [Vector3.Y(), Vector3(45, 45, 0), self.v2]
+
+        expected = [angle_between(v1, v2) for v1, v2 in zip(v1s, v2s)]
+        self.assertEqual(angle_between_many(v1s, v2s), expected)
+
+    def test_vector3_angle_between_raises_for_a_zero_length_vector(self) -> None:
+        for v1, v2 in [(Vector3(), self.v1), (self.v1, Vector3()), (Vector3(), Vector3())]:
+            with self.subTest(v1=v1, v2=v2):
+                with self.assertRaises(ZeroDivisionError):
+                    angle_between(v1, v2)
+
+                with self.assertRaises(ZeroDivisionError):
+                    angle_between_many([Vector3.X(), v1], [Vector3.Y(), v2])
+
     def test_vector3_cross_returns_the_cross_product_of_two_vectors(self) -> None:
         expected = Vector3(-9, -3, 1)
         self.assertAlmostEqual(cross(self.v1, self.v2), expected)
         self.assertAlmostEqual(cross(self.v2, self.v1), -expected)
 
+    def test_vector3_cross_many_returns_the_cross_product_of_each_pair(self) -> None:
+        v1s = [self.v1, self.v2, Vector3.X()]
+        v2s = [self.v2, self.v1, Vector3.Y()]
+
+        expected = [cross(v1, v2) for v1, v2 in zip(v1s, v2s)]
+        self.assertEqual(cross_many(v1s, v2s), expected)
+
     def test_vector3_is_orthonormal_basis_returns_true_for_an_orthonormal_basis(self) -> None:
         basis = [Vector3.X(), Vector3.Y(), Vector3.Z()]
         self.assertTrue(is_orthonormal_basis(*basis))
@@ -171,3 +236,12 @@ class TestVector3(unittest.TestCase):
         expected = self.v1
 
         self.assertEqual(result, expected)
+
+    def test_vector3_normalize_many_returns_each_normalized_vector(self) -> None:
+        vectors = [self.v1, self.v2, 3 * Vector3.Z()]
+
+        self.assertEqual(normalize_many(vectors), [normalize(v) for v in vectors])
+
+    def test_vector3_normalize_many_raises_for_a_zero_vector(self) -> None:
+        with self.assertRaises(ZeroDivisionError):
+            normalize_many([self.v1, Vector3()])